@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional
 from .base import Agent, register_agent
 from .memory import MemoryManager
 from .tools import ToolManager
-from ..config import get_settings
+from ..config import MEMORY_WINDOW_VAR, get_settings
 from ..env.actions import ACTION_TOOL_SPEC, parse_action, system_prompt_v1
 
 
@@ -998,6 +998,9 @@ class AnthropicKeystrokeAgent(Agent):
         self._tool_events: List[Dict[str, Any]] = []
 
     def _resolve_memory_window(self) -> int:
+        override = MEMORY_WINDOW_VAR.get()
+        if override is not None:
+            return override
         env_value = os.getenv("FORT_GYM_MEMORY_WINDOW")
         if env_value is not None:
             return int(env_value)
@@ -7,6 +7,7 @@ import hashlib
 import html
 import os
 import threading
+from contextlib import asynccontextmanager
 from datetime import datetime
 from importlib import import_module
 from pathlib import Path
@@ -57,9 +58,18 @@ from .schemas import (
     ShareCreate,
 )
 from .trace_preview import read_trace_preview
-from .sse import ndjson_iter, sse_event, stream_queue
+from .sse import ndjson_iter, parse_last_event_id, sse_event, stream_queue
 
-app = FastAPI(title="fort-gym API")
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    yield
+    # Queued score/milestone updates only reach SQLite on the flusher's
+    # interval; write them before the process exits.
+    RUN_REGISTRY.close()
+
+
+app = FastAPI(title="fort-gym API", lifespan=_lifespan)
 app.include_router(step_router)
 
 _RATE_LIMITER = RateLimiter()
@@ -754,7 +764,7 @@ async def health() -> JSONResponse:
 
 @app.get("/runs", response_model=List[RunInfo])
 async def list_runs(_: None = Depends(require_admin)) -> List[RunInfo]:
-    return [_serialize(record) for record in RUN_REGISTRY.list()]
+    return [_serialize(record) for record in RUN_REGISTRY.list(include_summary=False)]
 
 
 OPTIONAL_AGENT_MODULES = {
@@ -892,7 +902,11 @@ async def stream_events(
     queue = RUN_REGISTRY.get_queue(run_id)
     if queue is None:
         raise HTTPException(status_code=404, detail="Run not found")
-    generator = stream_queue(request, queue)
+    generator = stream_queue(
+        request,
+        queue,
+        last_event_id=parse_last_event_id(request.headers.get("last-event-id")),
+    )
     return StreamingResponse(generator, media_type="text/event-stream")
 
 
@@ -968,7 +982,7 @@ async def export_trace(
 
 @app.get("/public/runs", response_model=List[RunInfoPublic])
 async def public_runs() -> List[RunInfoPublic]:
-    items = RUN_REGISTRY.list_public()
+    items = RUN_REGISTRY.list_public(include_summary=False)
     return [_serialize_public(record, share) for record, share in items]
 
 
@@ -1208,7 +1222,12 @@ async def public_stream(token: str, request: Request) -> StreamingResponse:
     if queue is None:
         raise HTTPException(status_code=404, detail="Run not found")
     return StreamingResponse(
-        stream_queue(request, queue), media_type="text/event-stream"
+        stream_queue(
+            request,
+            queue,
+            last_event_id=parse_last_event_id(request.headers.get("last-event-id")),
+        ),
+        media_type="text/event-stream",
     )
 
 
@@ -6,38 +6,66 @@ import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Iterator
+from typing import Any, AsyncGenerator, Dict, Iterator, Optional
 
 from fastapi import Request
 
+from ..run.storage import EventBuffer
 
-def sse_event(event_type: str, data: Dict) -> str:
+
+def sse_event(event_type: str, data: Dict, event_id: Optional[int] = None) -> str:
     """Serialize an SSE frame for the provided payload."""
 
-    return f"event: {event_type}\n" f"data: {json.dumps(data)}\n\n"
+    if event_id is None:
+        return f"event: {event_type}\n" f"data: {json.dumps(data)}\n\n"
+    return f"event: {event_type}\n" f"id: {event_id}\n" f"data: {json.dumps(data)}\n\n"
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Return the sequence number from a ``Last-Event-ID`` header, if valid."""
+
+    if not value:
+        return None
+    try:
+        seq = int(value)
+    except ValueError:
+        return None
+    return seq if seq >= 0 else None
 
 
 async def stream_queue(
     request: Request,
-    queue: asyncio.Queue[Dict[str, Any]],
+    queue: EventBuffer,
     *,
     heartbeat: float = 5.0,
+    last_event_id: Optional[int] = None,
 ) -> AsyncGenerator[str, None]:
-    """Yield frames from an asyncio queue until the client disconnects."""
+    """Yield frames from a run's event buffer until the client disconnects.
+
+    Each connection reads with its own cursor, so concurrent spectators all
+    see every event. Frames carry the event's sequence number as their SSE
+    ``id``; ``last_event_id`` resumes a reconnecting client after it.
+    """
 
+    cursor = 0 if last_event_id is None else last_event_id + 1
     try:
         while True:
             if await request.is_disconnected():
                 break
             try:
-                item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                next_seq, items = await asyncio.wait_for(
+                    queue.wait_since(cursor), timeout=heartbeat
+                )
             except asyncio.TimeoutError:
                 yield sse_event("heartbeat", {"ts": datetime.utcnow().isoformat() + "Z"})
                 continue
 
-            event_type = item.get("t", "message")
-            data = item.get("data", {})
-            yield sse_event(event_type, data)
+            first_seq = next_seq - len(items)
+            for offset, item in enumerate(items):
+                event_type = item.get("t", "message")
+                data = item.get("data", {})
+                yield sse_event(event_type, data, event_id=first_seq + offset)
+            cursor = next_seq
     except asyncio.CancelledError:
         pass
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from contextvars import ContextVar
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
@@ -14,6 +15,10 @@ from pydantic import BaseModel
 DFROOT = Path(os.getenv("DFROOT", "/opt/dwarf-fortress"))
 DFHACK_RUN = DFROOT / "dfhack-run"
 
+# Per-context override for Settings.MEMORY_WINDOW; lets concurrent experiment
+# variants pick their own window without mutating process-wide os.environ.
+MEMORY_WINDOW_VAR: ContextVar[Optional[int]] = ContextVar("memory_window", default=None)
+
 
 def dfhack_cmd(*args: str) -> list[str]:
     """Return the absolute dfhack-run command sequence for subprocess calls.
@@ -83,13 +88,22 @@ class Settings(BaseModel):
     KEYSTROKE_ACTION_HISTORY_LIMIT: int = int(
         os.getenv("FORT_GYM_KEYSTROKE_ACTION_HISTORY_LIMIT", "30")
     )
+    TRACE_BATCH_SIZE: int = int(os.getenv("FORT_GYM_TRACE_BATCH", "16"))
 
     class Config:
         frozen = True
 
 
-@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    settings = _cached_settings()
+    memory_window = MEMORY_WINDOW_VAR.get()
+    if memory_window is None:
+        return settings
+    return settings.model_copy(update={"MEMORY_WINDOW": memory_window})
+
+
+@lru_cache(maxsize=1)
+def _cached_settings() -> Settings:
     _load_dotenv()
     return Settings(
         DFHACK_ENABLED=bool(int(os.getenv("DFHACK_ENABLED", "0"))),
@@ -130,9 +144,13 @@ def get_settings() -> Settings:
         KEYSTROKE_ACTION_HISTORY_LIMIT=int(
             os.getenv("FORT_GYM_KEYSTROKE_ACTION_HISTORY_LIMIT", "30")
         ),
+        TRACE_BATCH_SIZE=int(os.getenv("FORT_GYM_TRACE_BATCH", "16")),
     )
 
 
+get_settings.cache_clear = _cached_settings.cache_clear  # type: ignore[attr-defined]
+
+
 def have_openai() -> bool:
     return bool(get_settings().OPENAI_API_KEY)
 
@@ -146,6 +164,7 @@ def have_anthropic() -> bool:
 
 
 __all__ = [
+    "MEMORY_WINDOW_VAR",
     "Settings",
     "get_settings",
     "have_openai",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..eval.gates import G7_DURATION_TICKS, G7_MIN_FUNCTIONAL_ROOMS, G7_MIN_POPULATION
@@ -233,7 +234,20 @@ def _screen_visual_hint_texts(screen_text: str) -> List[str]:
 def _classify_screen_state(
     screen_text: Optional[str], viewscreen_type: Optional[str] = None
 ) -> Dict[str, Any]:
-    captured_screen = screen_text or ""
+    # DF stays paused between steps, so consecutive captures often repeat
+    # verbatim; classify each distinct screen once and hand out copies.
+    if viewscreen_type is not None and not isinstance(viewscreen_type, str):
+        return _classify_screen_text(screen_text or "", viewscreen_type)
+    cached = _classify_screen_text_cached(screen_text or "", viewscreen_type)
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in cached.items()
+    }
+
+
+def _classify_screen_text(
+    captured_screen: str, viewscreen_type: Optional[str] = None
+) -> Dict[str, Any]:
     lower = captured_screen.lower()
     lines = _screen_text_lines(captured_screen)
     visual_hints = _screen_visual_hint_texts(captured_screen)
@@ -493,6 +507,9 @@ def _classify_screen_state(
     )
 
 
+_classify_screen_text_cached = lru_cache(maxsize=16)(_classify_screen_text)
+
+
 def _compute_screen_diff(prev: str, curr: str) -> Dict[str, Any]:
     """Compare two screen captures and return diff info."""
     if not prev or not curr:
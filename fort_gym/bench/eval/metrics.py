@@ -532,7 +532,7 @@ def step_snapshot(state: Dict[str, Any]) -> Dict[str, Any]:
 
     hostiles_raw = state.get("hostiles")
     if hostiles_raw is None:
-        risks = state.get("risks") or []
+        risks = state.get("risks") or ()
         hostiles_raw = any("hostile" in str(r).lower() for r in risks)
     if hostiles_raw is None:
         hostiles_raw = bool(hazards.get("hostiles"))
@@ -136,14 +136,19 @@ def score_components(summary: Dict[str, float]) -> Dict[str, float]:
     }
 
 
-def composite_score(summary: Dict[str, float]) -> float:
+def composite_score(
+    summary: Dict[str, float],
+    components: Optional[Dict[str, float]] = None,
+) -> float:
     """Compute a heuristic composite score from summary aggregates.
 
     Accepts both summary format (duration_ticks, peak_pop, drink_availability, created_wealth)
-    and metrics format (time, pop, drink, wealth).
+    and metrics format (time, pop, drink, wealth). Callers that already hold
+    ``score_components(summary)`` can pass it in to avoid recomputing it.
     """
 
-    components = score_components(summary)
+    if components is None:
+        components = score_components(summary)
     penalties = 0.0
     if summary.get("casualty_spike"):
         penalties += CASUALTY_PENALTY
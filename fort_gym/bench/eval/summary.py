@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -133,6 +134,10 @@ def _model_dump(model: BaseModel) -> Dict[str, Any]:
 
 
 def _to_int(value: Any, default: int = 0) -> int:
+    if type(value) is int:
+        return value
+    if value is None:
+        return default
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -272,7 +277,7 @@ def summarize(trace_path: Path) -> RunSummary:
                 marker_surfaces.append(("metrics.score_version", metrics_snapshot, "score_version"))
             if isinstance(record.get("score"), dict):
                 marker_surfaces.append(("score.version", score_payload, "version"))
-            for index, event in enumerate(record.get("events", []) or []):
+            for index, event in enumerate(record.get("events") or ()):
                 if not isinstance(event, dict) or event.get("type") != "score":
                     continue
                 data = event.get("data") if isinstance(event.get("data"), dict) else {}
@@ -611,11 +616,11 @@ def summarize(trace_path: Path) -> RunSummary:
             if isinstance(hostiles, bool):
                 hostiles_present = hostiles
 
-            for event in record.get("events", []) or []:
+            for event in record.get("events") or ():
                 if event.get("type") != "score":
                     continue
                 data = event.get("data", {})
-                event_milestones = data.get("milestones") or []
+                event_milestones = data.get("milestones") or ()
                 for item in event_milestones:
                     if isinstance(item, dict):
                         milestones.append(item)
@@ -675,7 +680,7 @@ def summarize(trace_path: Path) -> RunSummary:
     }
 
     components = score_components(summary_payload)
-    total_score = composite_score(summary_payload)
+    total_score = composite_score(summary_payload, components)
 
     summary = RunSummary(
         run_id=run_id,
@@ -764,7 +769,10 @@ def summarize(trace_path: Path) -> RunSummary:
     summary.task_verdict = str(summary.g7.get("status") or "unknown")
 
     summary_path = trace_path.with_name("summary.json")
-    summary_path.write_text(json.dumps(_model_dump(summary), indent=2), encoding="utf-8")
+    tmp_path = summary_path.with_name(summary_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(_model_dump(summary), handle, indent=2)
+    os.replace(tmp_path, summary_path)
     return summary
 
 
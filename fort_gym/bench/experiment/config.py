@@ -10,8 +10,11 @@ import yaml
 
 from ..eval.protocol import validate_evaluation_protocol
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BaseRunConfig:
     backend: str
     max_steps: int
@@ -23,14 +26,14 @@ class BaseRunConfig:
     runtime_save: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VariantConfig:
     name: str
     memory_window: int
     model: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperimentConfig:
     name: str
     description: str | None
@@ -44,7 +47,7 @@ class ExperimentConfigError(ValueError):
 
 
 def load_experiment_config(path: Path) -> ExperimentConfig:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
     if raw is None:
         raise ExperimentConfigError(f"Experiment config is empty: {path}")
     if not isinstance(raw, Mapping):
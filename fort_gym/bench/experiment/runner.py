@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 import json
-import os
+import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 from typing import Mapping
 
 from .config import BaseRunConfig, ExperimentConfig, VariantConfig, load_experiment_config
 from ..agent.base import AGENT_FACTORIES, Agent
-from ..config import get_settings
+from ..config import MEMORY_WINDOW_VAR, get_settings
 from ..eval.fort_eval_easy_p1 import P1_PROTOCOL
 from ..run.runner import run_once
 from ..run.storage import RUN_REGISTRY
 
+_SUMMARY_READ_WORKERS = 16
+
 
 @dataclass(frozen=True)
 class VariantRun:
@@ -104,25 +109,31 @@ class ExperimentRunner:
         return self.run(config, config_path=resolved_path)
 
     def run(self, config: ExperimentConfig, *, config_path: Path | None = None) -> ExperimentResult:
-        _ensure_agent_factories()
         experiment_id = _new_experiment_id()
         started_at = datetime.utcnow()
         experiment_dir = self._experiment_dir(config.name, experiment_id)
         experiment_dir.mkdir(parents=True, exist_ok=True)
         if config_path is not None:
-            (experiment_dir / "config.yaml").write_text(
-                config_path.read_text(encoding="utf-8"),
-                encoding="utf-8",
-            )
+            shutil.copyfile(config_path, experiment_dir / "config.yaml")
 
-        variants_results: list[VariantResult] = []
+        completed: list[tuple[VariantConfig, dict[str, int | str | bool | None], list[str]]] = []
         for variant in config.variants:
             resolved = _resolve_variant(config.base_config, variant)
-            runs: list[VariantRun] = []
-            for index in range(config.runs_per_variant):
-                run_id = self._run_variant(resolved, variant)
-                summary = _load_summary(self._artifacts_root, run_id)
-                runs.append(VariantRun(run_id=run_id, run_index=index + 1, summary=summary))
+            run_ids = [
+                self._run_variant(resolved, variant) for _ in range(config.runs_per_variant)
+            ]
+            completed.append((variant, resolved, run_ids))
+
+        summaries = _load_summaries(
+            self._artifacts_root,
+            [run_id for _, _, run_ids in completed for run_id in run_ids],
+        )
+        variants_results: list[VariantResult] = []
+        for variant, resolved, run_ids in completed:
+            runs = [
+                VariantRun(run_id=run_id, run_index=index + 1, summary=summaries.get(run_id))
+                for index, run_id in enumerate(run_ids)
+            ]
             variants_results.append(
                 VariantResult(
                     name=variant.name,
@@ -241,60 +252,74 @@ def _write_result(experiment_dir: Path, result: ExperimentResult) -> None:
 
 def _load_summary(artifacts_root: Path, run_id: str) -> Mapping[str, object] | None:
     summary_path = artifacts_root / run_id / "summary.json"
-    if not summary_path.is_file():
-        return None
     try:
         return json.loads(summary_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    except (OSError, json.JSONDecodeError):
         return None
 
 
+def _load_summaries(
+    artifacts_root: Path, run_ids: list[str]
+) -> dict[str, Mapping[str, object] | None]:
+    """Read run summaries concurrently so file latency overlaps across runs."""
+
+    if not run_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(_SUMMARY_READ_WORKERS, len(run_ids))) as pool:
+        loaded = pool.map(lambda run_id: _load_summary(artifacts_root, run_id), run_ids)
+        return dict(zip(run_ids, loaded))
+
+
 @contextmanager
 def _memory_window_context(value: int | None):
     if value is None:
         yield
         return
-    previous = os.environ.get("FORT_GYM_MEMORY_WINDOW")
-    os.environ["FORT_GYM_MEMORY_WINDOW"] = str(value)
-    get_settings.cache_clear()  # type: ignore[attr-defined]
+    token = MEMORY_WINDOW_VAR.set(value)
     try:
         yield
     finally:
-        if previous is None:
-            os.environ.pop("FORT_GYM_MEMORY_WINDOW", None)
-        else:
-            os.environ["FORT_GYM_MEMORY_WINDOW"] = previous
-        get_settings.cache_clear()  # type: ignore[attr-defined]
+        MEMORY_WINDOW_VAR.reset(token)
+
+
+# Agent name prefix -> module that registers it, most specific prefix first.
+_AGENT_MODULES: tuple[tuple[str, str], ...] = (
+    ("fake", "fake_llm"),
+    ("dfhack-governed-scripted", "governed"),
+    ("dfhack-governed-llm", "governed_llm"),
+    ("anthropic-research", "llm_anthropic_research"),
+    ("anthropic", "llm_anthropic"),
+    ("openai", "llm_openai"),
+    ("openrouter", "llm_openrouter"),
+)
 
 
 def _make_agent(name: str) -> Agent:
+    _ensure_agent_factory(name)
     factory = AGENT_FACTORIES.get(name)
+    if factory is None:
+        _ensure_agent_factories()
+        factory = AGENT_FACTORIES.get(name)
     if factory is None:
         available = ", ".join(sorted(AGENT_FACTORIES.keys()))
         raise ValueError(f"Unknown agent '{name}'. Available: {available}")
     return factory()
 
 
+@lru_cache(maxsize=None)
+def _ensure_agent_factory(name: str) -> None:
+    """Import only the agent module that registers ``name``."""
+
+    for prefix, module in _AGENT_MODULES:
+        if name.startswith(prefix):
+            import_module(f"..agent.{module}", __package__)
+            return
+
+
+@lru_cache(maxsize=1)
 def _ensure_agent_factories() -> None:
-    from ..agent import (
-        fake_llm,
-        governed,
-        governed_llm,
-        llm_anthropic,
-        llm_anthropic_research,
-        llm_openai,
-        llm_openrouter,
-    )
-
-    _ = (
-        fake_llm,
-        governed,
-        governed_llm,
-        llm_anthropic,
-        llm_anthropic_research,
-        llm_openai,
-        llm_openrouter,
-    )
+    for _, module in _AGENT_MODULES:
+        import_module(f"..agent.{module}", __package__)
 
 
 __all__ = [
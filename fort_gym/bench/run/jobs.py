@@ -22,12 +22,19 @@ class JobInfo(BaseModel):
     finished_at: Optional[datetime] = None
 
 
+def _snapshot(job: JobInfo) -> JobInfo:
+    # Shallow, unvalidated copy: every field except run_ids is immutable, so
+    # only that list needs its own copy to keep callers off live state.
+    return job.model_copy(update={"run_ids": list(job.run_ids)})
+
+
 class JobRegistry:
     """Manage job metadata and run scheduling with a concurrency cap."""
 
     def __init__(self) -> None:
         self._jobs: Dict[str, JobInfo] = {}
         self._state: Dict[str, Dict[str, int]] = {}
+        self._done: Dict[str, threading.Event] = {}
         self._lock = threading.Lock()
 
     def create(self, model: str, backend: str, n: int, parallelism: int) -> JobInfo:
@@ -45,16 +52,26 @@ class JobRegistry:
         with self._lock:
             self._jobs[job.job_id] = job
             self._state[job.job_id] = {"started": 0, "completed": 0}
+            self._done[job.job_id] = threading.Event()
         return job
 
     def list(self) -> List[JobInfo]:
         with self._lock:
-            return [job.copy(deep=True) for job in self._jobs.values()]
+            return [_snapshot(job) for job in self._jobs.values()]
 
     def get(self, job_id: str) -> Optional[JobInfo]:
         with self._lock:
             job = self._jobs.get(job_id)
-            return job.copy(deep=True) if job else None
+            return _snapshot(job) if job else None
+
+    def wait_done(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """Block until the job completes or fails; False if ``timeout`` expires first."""
+
+        with self._lock:
+            done = self._done.get(job_id)
+        if done is None:
+            raise KeyError(job_id)
+        return done.wait(timeout)
 
     def start(self, job_id: str, make_run: Callable[[], str]) -> None:
         with self._lock:
@@ -95,12 +112,14 @@ class JobRegistry:
                     if failed or run_id is None:
                         job.status = "failed"
                         job.finished_at = datetime.utcnow()
+                        self._done[job_id].set()
                         return
                     job.run_ids.append(run_id)
                     state["completed"] += 1
                     if state["completed"] >= job.n:
                         job.status = "completed"
                         job.finished_at = datetime.utcnow()
+                        self._done[job_id].set()
                     else:
                         if job.status == "running" and state["started"] < job.n:
                             launch_another = True
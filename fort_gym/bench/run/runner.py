@@ -6,11 +6,20 @@ import asyncio
 import hashlib
 import json
 import os
+import queue
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from os import fsync
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:  # pragma: no cover - optional speedup, see the "speed" extra
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
 
 from ..agent.base import Agent
 from ..config import get_settings
@@ -90,10 +99,23 @@ MAX_INTERACT_OPERATIONS_PER_MODAL = 8
 MAX_UNCHANGED_INTERACT_SCREENS = 3
 MIN_GOVERNED_ACTION_HISTORY = 6
 SCREEN_CAPTURE_FAILED = "(screen capture failed)"
+# Per-step progress rows commit to SQLite; fast steps coalesce to this rate.
+# A skipped step is written before the next decide once the interval has
+# passed, so the stored step is at most STEP_STATUS_INTERVAL_S stale.
+# Terminal transitions always write the final step.
+STEP_STATUS_INTERVAL_S = 0.1
+
+
 def _screen_sha256(screen_text: str | None) -> str:
     return hashlib.sha256((screen_text or "").encode("utf-8")).hexdigest()
 
 
+def _utcnow() -> datetime:
+    """Naive UTC timestamp, the form the run registry stores and compares."""
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def _effective_action_history_limit(configured: Any, *, governed: bool) -> int:
     """Keep enough governed history for one review interval plus its checkpoint."""
 
@@ -101,18 +123,101 @@ def _effective_action_history_limit(configured: Any, *, governed: bool) -> int:
     return max(minimum, int(configured))
 
 
+_FRAGMENT_MARKER = "\x00fort-gym-fragment:"
+
+
+class _EncodedJSON:
+    """Already-encoded JSON that :func:`_json_bytes` splices in verbatim."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes) -> None:
+        self.raw = raw
+
+
+def _json_bytes(payload: Any, *, indent: bool = False) -> bytes:
+    """Encode ``payload`` with orjson when installed, else the stdlib encoder.
+
+    ``_EncodedJSON`` values are emitted as string placeholders and replaced
+    with their raw bytes afterwards, so a value shared by several fields is
+    encoded once. Fragments are compact; pass them only when ``indent`` is off.
+    """
+
+    fragments: List[bytes] = []
+
+    def default(value: Any) -> str:
+        if isinstance(value, _EncodedJSON):
+            fragments.append(value.raw)
+            return f"{_FRAGMENT_MARKER}{len(fragments) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    encoded: Optional[bytes] = None
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            encoded = orjson.dumps(payload, default=default, option=option)
+        except TypeError:  # orjson.JSONEncodeError; retry with json's coercions
+            fragments.clear()
+    if encoded is None:
+        if indent:
+            encoded = json.dumps(payload, indent=2, default=default).encode("utf-8")
+        else:
+            encoded = json.dumps(
+                payload, separators=(",", ":"), default=default
+            ).encode("utf-8")
+    if not fragments:
+        return encoded
+    marker = json.dumps(_FRAGMENT_MARKER)[:-1].encode("utf-8")
+    for index, raw in enumerate(fragments):
+        encoded = encoded.replace(marker + str(index).encode("ascii") + b'"', raw, 1)
+    return encoded
+
+
+def _share_observation(payload: Dict[str, Any]) -> None:
+    """Encode a row's observation once for both its field and its state event.
+
+    Step rows carry the observation at ``observation`` and again inside the
+    ``state`` event in ``events``; both reference the same dict, so encode it
+    once and splice the bytes into each position.
+    """
+
+    observation = payload.get("observation")
+    if not isinstance(observation, dict):
+        return
+    fragment = _EncodedJSON(_json_bytes(observation))
+    payload["observation"] = fragment
+    events = payload.get("events")
+    if not isinstance(events, list):
+        return
+    shared_events = []
+    for event in events:
+        data = event.get("data") if isinstance(event, dict) else None
+        if isinstance(data, dict) and data.get("state") is observation:
+            event = {**event, "data": {**data, "state": fragment}}
+        shared_events.append(event)
+    payload["events"] = shared_events
+
+
+def _score_event_unversioned(event: Any) -> bool:
+    if not isinstance(event, dict) or event.get("type") != "score":
+        return False
+    data = event.get("data")
+    return not isinstance(data, dict) or "version" not in data
+
+
 def _write_jsonl_record(fh: Any, record: Dict[str, Any]) -> None:
+    # Step rows normally arrive already versioned; only copy the nested
+    # containers that actually need a version stamp.
     payload = dict(record)
     payload.setdefault("score_version", scoring.SCORE_VERSION)
-    if isinstance(payload.get("metrics"), dict):
-        metrics_payload = dict(payload["metrics"])
-        metrics_payload.setdefault("score_version", scoring.SCORE_VERSION)
-        payload["metrics"] = metrics_payload
-    if isinstance(payload.get("score"), dict):
-        score_payload = dict(payload["score"])
-        score_payload.setdefault("version", scoring.SCORE_VERSION)
-        payload["score"] = score_payload
-    if isinstance(payload.get("events"), list):
+    metrics = payload.get("metrics")
+    if isinstance(metrics, dict) and "score_version" not in metrics:
+        payload["metrics"] = {**metrics, "score_version": scoring.SCORE_VERSION}
+    score = payload.get("score")
+    if isinstance(score, dict) and "version" not in score:
+        payload["score"] = {**score, "version": scoring.SCORE_VERSION}
+    events = payload.get("events")
+    if isinstance(events, list) and any(_score_event_unversioned(event) for event in events):
         versioned_events = []
         for event in payload["events"]:
             if not isinstance(event, dict) or event.get("type") != "score":
@@ -128,7 +233,108 @@ def _write_jsonl_record(fh: Any, record: Dict[str, Any]) -> None:
             event_payload["data"] = data_payload
             versioned_events.append(event_payload)
         payload["events"] = versioned_events
-    fh.write(json.dumps(payload) + "\n")
+    _share_observation(payload)
+    fh.write(_json_bytes(payload) + b"\n")
+
+
+class _TraceWriter:
+    """Append complete JSONL rows to a trace file from a background thread.
+
+    The step loop only enqueues encoded rows; a writer thread drains up to
+    ``batch_size`` queued rows per ``writelines`` call so disk I/O overlaps
+    with agent decisions and DF RPCs. ``flush`` blocks until every row queued
+    so far has reached the OS, which keeps durable terminal rows ordered.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: Path, *, batch_size: int, max_queue: int = 1024) -> None:
+        self._path = path
+        self._batch_size = max(1, batch_size)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._error: BaseException | None = None
+        self._fh: Any = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "_TraceWriter":
+        self._fh = self._path.open("wb", buffering=1 << 20)
+        self._thread = threading.Thread(
+            target=self._drain,
+            name=f"trace-writer-{self._path.parent.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            self._queue.put(self._STOP)
+            if self._thread is not None:
+                self._thread.join()
+        finally:
+            self._fh.close()
+        self._raise_if_failed()
+
+    def write(self, line: bytes) -> None:
+        self._raise_if_failed()
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_if_failed()
+
+    def fileno(self) -> int:
+        return self._fh.fileno()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Trace writer failed for {self._path}") from self._error
+
+    def _drain(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self._batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item for item in items if isinstance(item, bytes)]
+            try:
+                if self._error is None:
+                    if lines:
+                        self._fh.writelines(lines)
+                    self._fh.flush()
+            except BaseException as exc:  # surfaced to the step loop on next call
+                self._error = exc
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if any(item is self._STOP for item in items):
+                return
+
+
+def _call_with_retry(
+    label: str,
+    func: Callable[[], Any],
+    *,
+    retry: bool,
+    on_failure: Callable[[str], None],
+) -> Any:
+    """Call ``func``, retrying once after a DFHackError when ``retry`` is set."""
+
+    if not retry:
+        return func()
+    try:
+        return func()
+    except DFHackError as exc:
+        on_failure(f"{label} failed: {exc}")
+        try:
+            return func()
+        except DFHackError as final_exc:
+            on_failure(f"{label} failed again: {final_exc}")
+            raise
 
 
 def _write_durable_jsonl_record(fh: Any, record: Dict[str, Any]) -> None:
@@ -2337,7 +2543,7 @@ def run_once(
             )
         if not registry.claim_pending_run(
             run_identifier,
-            started_at=datetime.utcnow(),
+            started_at=_utcnow(),
         ):
             current = registry.get(run_identifier)
             current_status = current.status if current is not None else "missing"
@@ -2384,7 +2590,7 @@ def run_once(
             if registry and not cleanup_recorded:
                 registry.record_cleanup_completed(
                     run_identifier,
-                    completed_at=datetime.utcnow(),
+                    completed_at=_utcnow(),
                 )
                 cleanup_recorded = True
             dfhack_client = None
@@ -2412,14 +2618,14 @@ def run_once(
                     run_identifier,
                     status="failed",
                     step=0,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
             else:
                 registry.record_terminal_failure(
                     run_identifier,
                     terminal_reason=cleanup_terminal_reason(outcome),
                     step=0,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
             registry.clear_stop(run_identifier)
 
@@ -2526,7 +2732,15 @@ def run_once(
             fail_setup_after_cleanup()
             raise
 
+        # advance() re-pauses DF and reports the verified pause state, so the
+        # next step's pause RPC is redundant until something else touches DF.
+        repaused_by_advance = False
+
         def pause_env() -> None:
+            nonlocal repaused_by_advance
+            if repaused_by_advance:
+                repaused_by_advance = False
+                return
             dfhack_client.pause()
 
         def attach_crew_metrics(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -2592,6 +2806,8 @@ def run_once(
             )
 
         def apply_action(action_dict: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal repaused_by_advance
+            repaused_by_advance = False
             return executor.apply(
                 action_dict,
                 backend="dfhack",
@@ -2602,7 +2818,8 @@ def run_once(
         def advance_env(
             num_ticks: int, state_after_apply: Dict[str, Any] | None = None
         ) -> Dict[str, Any]:
-            nonlocal tick_info_state
+            nonlocal tick_info_state, repaused_by_advance
+            repaused_by_advance = False
             if num_ticks <= 0:
                 tick_info_state = {"ok": True, "ticks_advanced": 0, "skipped": True}
                 return observe()
@@ -2624,6 +2841,7 @@ def run_once(
                 )
             )
             tick_info_state = dict(dfhack_client.last_tick_info or {})
+            repaused_by_advance = tick_info_state.get("paused_after") is True
             return state
 
         if is_keystroke_mode or is_governed_dfhack_mode:
@@ -2740,6 +2958,34 @@ def run_once(
             return model.model_dump()
         return model.dict()  # type: ignore[attr-defined]
 
+    last_step_status_at: float | None = None
+    pending_step_status: int | None = None
+
+    def push_step_status(step_index: int | None = None) -> None:
+        """Record step progress, coalesced to ``STEP_STATUS_INTERVAL_S``.
+
+        A step skipped by the coalescing is kept pending; calling with no
+        step writes it once the interval has passed.
+        """
+
+        nonlocal last_step_status_at, pending_step_status
+        if registry is None:
+            return
+        if step_index is None:
+            step_index = pending_step_status
+            if step_index is None:
+                return
+        now = time.monotonic()
+        if (
+            last_step_status_at is not None
+            and now - last_step_status_at < STEP_STATUS_INTERVAL_S
+        ):
+            pending_step_status = step_index
+            return
+        last_step_status_at = now
+        pending_step_status = None
+        registry.set_status(run_identifier, step=step_index)
+
     def _handle_dfhack_failure(step_index: int, message: str, events: List[Dict[str, Any]]) -> None:
         publish_event(step_index, "stderr", {"message": message}, events)
 
@@ -2753,7 +2999,7 @@ def run_once(
     interaction_unchanged_screen_streak = 0
 
     try:
-        with trace_path.open("w", encoding="utf-8") as fh:
+        with _TraceWriter(trace_path, batch_size=settings.TRACE_BATCH_SIZE) as fh:
             def record_pre_execution_rejection(
                 *,
                 step: int,
@@ -2802,8 +3048,7 @@ def run_once(
 
                 if terminal_reason is None:
                     _write_jsonl_record(fh, record_line)
-                    if registry:
-                        registry.set_status(run_identifier, step=step)
+                    push_step_status(step)
                     return False
 
                 terminal_data = {
@@ -2829,6 +3074,8 @@ def run_once(
                 run_failed = True
                 return True
 
+            retry_dfhack = backend_name == "dfhack"
+            captures_screen = is_keystroke_mode or is_governed_dfhack_mode
             for step in range(max_steps):
                 last_step = step
                 events: List[Dict[str, Any]] = []
@@ -3001,23 +3248,12 @@ def run_once(
                                 "no_progress_streak": ui_no_progress_streak,
                             }
 
-                def call_with_retry(label: str, func):
-                    if backend_name != "dfhack":
-                        return func()
-                    try:
-                        return func()
-                    except DFHackError as exc:
-                        _handle_dfhack_failure(step, f"{label} failed: {exc}", events)
-                        try:
-                            return func()
-                        except DFHackError as final_exc:
-                            _handle_dfhack_failure(
-                                step, f"{label} failed again: {final_exc}", events
-                            )
-                            raise
+                on_dfhack_failure = partial(_handle_dfhack_failure, step, events=events)
 
                 try:
-                    state_before = call_with_retry("observe", observe)
+                    state_before = _call_with_retry(
+                        "observe", observe, retry=retry_dfhack, on_failure=on_dfhack_failure
+                    )
                 except DFHackError:
                     run_failed = True
                     break
@@ -3061,9 +3297,7 @@ def run_once(
                         state_before,
                         carpenter_workshop_usable_seen,
                     )
-                screen_text = (
-                    get_screen_text() if is_keystroke_mode or is_governed_dfhack_mode else None
-                )
+                screen_text = get_screen_text() if captures_screen else None
                 if (
                     str(state_before.get("viewscreen_type") or "unknown")
                     not in INTERACT_ALLOWED_VIEWSCREEN_TYPES
@@ -3326,6 +3560,8 @@ def run_once(
                     )
                     break
 
+                # Land a coalesced step before a potentially slow decide.
+                push_step_status()
                 try:
                     raw_action = agent.decide(obs_text, obs_json)
                 except Exception as exc:
@@ -3622,8 +3858,11 @@ def run_once(
                     apply_state = obs_json
                     if action.get("type") == "INTERACT":
                         apply_state = {**obs_json, "screen_text": screen_text}
-                    execute_result = call_with_retry(
-                        "apply", lambda: apply_action(action, apply_state)
+                    execute_result = _call_with_retry(
+                        "apply",
+                        lambda: apply_action(action, apply_state),
+                        retry=retry_dfhack,
+                        on_failure=on_dfhack_failure,
                     )
                 except DFHackError:
                     run_failed = True
@@ -3786,9 +4025,11 @@ def run_once(
                     }
                 else:
                     try:
-                        advance_state = call_with_retry(
+                        advance_state = _call_with_retry(
                             "advance",
                             lambda: advance_env(requested_ticks, state_after_apply),
+                            retry=retry_dfhack,
+                            on_failure=on_dfhack_failure,
                         )
                     except DFHackError:
                         run_failed = True
@@ -4649,8 +4890,7 @@ def run_once(
                     run_failed = True
                     break
 
-                if registry:
-                    registry.set_status(run_identifier, step=step)
+                push_step_status(step)
 
         cleanup_outcome = cleanup_dfhack_runtime()
         if not cleanup_outcome.get("ok"):
@@ -4710,9 +4950,12 @@ def run_once(
                 summary=summary_payload,
             )
         summary_path = trace_path.with_name("summary.json")
-        summary_path.write_text(json.dumps(_dump_model(summary), indent=2), encoding="utf-8")
+        final_summary = _dump_model(summary)
+        summary_tmp = summary_path.with_name(summary_path.name + ".tmp")
+        summary_tmp.write_bytes(_json_bytes(final_summary, indent=True))
+        os.replace(summary_tmp, summary_path)
         if registry:
-            registry.set_summary(run_identifier, _dump_model(summary))
+            registry.set_summary(run_identifier, final_summary)
             registry.append_event(
                 run_identifier,
                 {
@@ -4730,7 +4973,7 @@ def run_once(
                     run_identifier,
                     terminal_reason=terminal_failure_reason,
                     step=terminal_failure_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
                 registry.clear_stop(run_identifier)
             elif run_failed:
@@ -4738,7 +4981,7 @@ def run_once(
                     run_identifier,
                     status="failed",
                     step=last_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
                 registry.clear_stop(run_identifier)
             elif run_stopped:
@@ -4746,14 +4989,14 @@ def run_once(
                     run_identifier,
                     status="stopped",
                     step=last_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
                 registry.clear_stop(run_identifier)
             else:
                 registry.finalize_success_after_cleanup(
                     run_identifier,
                     step=last_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
 
         # Auto-analyze trace with LLM (optional - requires GOOGLE_API_KEY)
@@ -4777,7 +5020,7 @@ def run_once(
                     run_identifier,
                     status="failed",
                     step=last_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
             else:
                 registry.record_terminal_failure(
@@ -4787,7 +5030,7 @@ def run_once(
                         prior_reason=terminal_failure_reason,
                     ),
                     step=last_step,
-                    ended_at=datetime.utcnow(),
+                    ended_at=_utcnow(),
                 )
             registry.clear_stop(run_identifier)
         raise
@@ -4803,4 +5046,17 @@ def run_once(
     return run_identifier
 
 
-__all__ = ["run_once"]
+async def run_once_async(agent: Agent, **kwargs: Any) -> str:
+    """Await :func:`run_once` on a worker thread.
+
+    Agents block on provider HTTP calls, so independent runs awaited together
+    with ``asyncio.gather`` overlap those waits inside one process. The running
+    loop is bound for live events unless ``loop`` is passed. dfhack runs share
+    the single live DF instance and must still be awaited one at a time.
+    """
+
+    kwargs.setdefault("loop", asyncio.get_running_loop())
+    return await asyncio.to_thread(run_once, agent, **kwargs)
+
+
+__all__ = ["run_once", "run_once_async"]
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import shutil
 import socket
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Optional
@@ -120,8 +122,73 @@ def reset_current_from_seed(
 def _reset_with_shutil(seed_dir: Path, runtime_dir: Path) -> None:
     if runtime_dir.exists():
         shutil.rmtree(runtime_dir)
-    shutil.copytree(seed_dir, runtime_dir, symlinks=True)
-    _make_writable(runtime_dir)
+    if _clone_tree(seed_dir, runtime_dir):
+        _make_writable(runtime_dir)
+        return
+    # Files get their write bit as they are copied; only directories, whose
+    # modes copytree restores after filling them, need a second pass.
+    shutil.copytree(seed_dir, runtime_dir, symlinks=True, copy_function=_copy_writable)
+    _make_dirs_writable(runtime_dir)
+
+
+def _copy_writable(src: str, dst: str) -> str:
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    os.chmod(dst, os.stat(dst).st_mode | 0o200)  # add user-write
+    return dst
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy file bytes in-kernel; unlike sendfile this can reflink or offload."""
+
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            size = os.fstat(source.fileno()).st_size
+            copied = 0
+            while True:
+                sent = os.copy_file_range(source.fileno(), target.fileno(), 1 << 30)
+                if not sent:
+                    break
+                copied += sent
+    except OSError:
+        return False
+    # Some kernels return 0 without copying (notably across filesystems);
+    # a short copy must fall back rather than leave a truncated save file.
+    return copied == size
+
+
+def _make_dirs_writable(path: Path) -> None:
+    for dirpath, _dirnames, _filenames in os.walk(path):
+        try:
+            os.chmod(dirpath, os.stat(dirpath).st_mode | 0o200)
+        except OSError:
+            continue
+
+
+def _clone_tree(seed_dir: Path, runtime_dir: Path) -> bool:
+    """Copy via the platform ``cp`` so CoW filesystems clone instead of copying bytes."""
+
+    if sys.platform.startswith("linux"):
+        command = ["cp", "-a", "--reflink=auto", "--", str(seed_dir), str(runtime_dir)]
+    elif sys.platform == "darwin":
+        command = ["cp", "-a", "-c", "--", str(seed_dir), str(runtime_dir)]
+    else:
+        return False
+    if shutil.which("cp") is None:
+        return False
+    result = subprocess.run(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    if result.returncode == 0:
+        return True
+    shutil.rmtree(runtime_dir, ignore_errors=True)
+    return False
 
 
 def _reset_with_sudo(seed_dir: Path, runtime_dir: Path) -> None:
@@ -131,14 +198,48 @@ def _reset_with_sudo(seed_dir: Path, runtime_dir: Path) -> None:
 
 
 def _make_writable(path: Path) -> None:
-    for entry in path.rglob("*"):
+    # One chmod(1) process walks the tree in C; matches the sudo path below.
+    try:
+        subprocess.check_call(
+            ["chmod", "-R", "u+w", "--", str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    _make_writable_walk(path)
+
+
+def _make_writable_walk(path: Path) -> None:
+    pending = [os.fspath(path)]
+    while pending:
         try:
-            mode = entry.stat().st_mode
-            entry.chmod(mode | 0o200)  # add user-write
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        mode = entry.stat(follow_symlinks=False).st_mode
+                        os.chmod(entry.path, mode | 0o200)  # add user-write
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
         except OSError:
             continue
 
 
+# Readiness probes back off from 20ms to 500ms so a fast DF start is seen
+# almost immediately while slow starts are still polled at the old rate.
+_POLL_INITIAL_S = 0.02
+_POLL_MAX_S = 0.5
+
+
+def _next_poll_delay(delay: float) -> float:
+    return min(delay * 1.5, _POLL_MAX_S)
+
+
 def _restart_dfhack_headless(host: str, port: int, *, timeout_s: float) -> None:
     if shutil.which("systemctl") is None:
         return
@@ -150,13 +251,15 @@ def _restart_dfhack_headless(host: str, port: int, *, timeout_s: float) -> None:
 def _wait_for_port(host: str, port: int, timeout_s: float) -> None:
     deadline = time.monotonic() + timeout_s
     last_error: Optional[Exception] = None
+    delay = _POLL_INITIAL_S
     while time.monotonic() < deadline:
         try:
             with socket.create_connection((host, port), timeout=1):
                 return
         except OSError as exc:
             last_error = exc
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = _next_poll_delay(delay)
     raise SeedResetError(f"DFHack RPC did not come up on {host}:{port}: {last_error}")
 
 
@@ -299,6 +402,7 @@ def _resolve_loadable_save_name(
 def _wait_for_map_loaded(*, timeout_s: float) -> None:
     deadline = time.monotonic() + timeout_s
     last_error: Optional[Exception] = None
+    delay = _POLL_INITIAL_S
     while time.monotonic() < deadline:
         try:
             out = run_lua_expr(
@@ -309,7 +413,8 @@ def _wait_for_map_loaded(*, timeout_s: float) -> None:
                 return
         except DFHackError as exc:
             last_error = exc
-        time.sleep(0.5)
+        time.sleep(delay)
+        delay = _next_poll_delay(delay)
 
     raise SeedResetError(f"Timed out waiting for DF map to load: {last_error}")
 
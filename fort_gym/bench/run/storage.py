@@ -1,7 +1,7 @@
 """SQLite-backed registry tracking runs, share tokens, and streaming events.
 
 Runs and share tokens persist across API restarts via SQLite. Live SSE events are
-still delivered via in-memory asyncio queues and are not replayed from the DB
+still delivered via in-memory event buffers and are not replayed from the DB
 (replay uses the persisted NDJSON trace file).
 """
 
@@ -16,7 +16,7 @@ import subprocess
 import threading
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Set, Tuple
 
@@ -25,6 +25,146 @@ from ..eval.protocol import validate_evaluation_protocol
 
 EventPayload = Dict[str, Any]
 
+EVENT_BUFFER_SIZE = 512
+SCORE_FLUSH_INTERVAL_S = 0.1
+
+_FULL_SHARE_SCOPE = frozenset({"live", "replay", "export"})
+_EVIDENCE_SHARE_SCOPE = frozenset({"replay", "export"})
+
+# Every ``runs`` column except ``summary_json``: summary-free listings do not
+# read the (largest) column out of SQLite at all.
+_RUN_LISTING_COLUMNS = (
+    "run_id, backend, model, max_steps, ticks_per_step, status, step, created_at, "
+    "started_at, ended_at, git_sha, seed_save, runtime_save, preserve_save, "
+    "evaluation_protocol, artifacts_dir, trace_path, last_score, total_score, "
+    "survival_score, milestones_json, terminal_reason_json, stop_requested_at, "
+    "cleanup_completed_at"
+)
+
+
+class EventBuffer:
+    """Bounded live-event ring for one run's SSE streams.
+
+    Every event gets a monotonically increasing sequence number and lands in
+    a fixed ring slot, so a full buffer overwrites its oldest event instead
+    of raising ``QueueFull``: spectators want the latest state. Streams read
+    with their own cursor through :meth:`wait_since`/:meth:`since`, which lets
+    several spectators follow one run and lets a reconnecting client resume
+    from its ``Last-Event-ID``.
+
+    ``get``/``get_nowait`` keep the ``asyncio.Queue`` interface on a single
+    built-in cursor; events overwritten before that cursor reads them are
+    counted in ``dropped`` so backpressure loss is visible.
+
+    There is one producer per run, and it may run on any thread. The
+    consumer's wakeup is handed to the consumer's loop when the producer is
+    not running on it.
+    """
+
+    def __init__(self, maxsize: int = EVENT_BUFFER_SIZE) -> None:
+        self._size = maxsize
+        self._ring: list[Optional[EventPayload]] = [None] * maxsize
+        self._write_seq = 0
+        self._read_seq = 0
+        self._ready = asyncio.Event()
+        self._consumer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._size
+
+    @property
+    def write_seq(self) -> int:
+        """Sequence number the next event will get."""
+
+        return self._write_seq
+
+    def qsize(self) -> int:
+        return self._write_seq - self._read_seq
+
+    def empty(self) -> bool:
+        return self._read_seq == self._write_seq
+
+    def put_nowait(self, item: EventPayload) -> None:
+        seq = self._write_seq
+        self._ring[seq % self._size] = item
+        self._write_seq = seq + 1
+        if self._write_seq - self._read_seq > self._size:
+            self._read_seq += 1
+            self.dropped += 1
+        self._notify()
+
+    def get_nowait(self) -> EventPayload:
+        seq = self._read_seq
+        if seq == self._write_seq:
+            raise asyncio.QueueEmpty
+        self._read_seq = seq + 1
+        return self._ring[seq % self._size]  # type: ignore[return-value]
+
+    async def get(self) -> EventPayload:
+        self._bind_consumer()
+        while self._read_seq == self._write_seq:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def since(self, seq: int) -> Tuple[int, list[EventPayload]]:
+        """Return ``(next_seq, events)`` for every retained event from ``seq`` on.
+
+        ``seq`` is clamped to the oldest retained event, so a cursor that fell
+        more than ``maxsize`` events behind skips what was overwritten.
+        """
+
+        end = self._write_seq
+        start = max(seq, end - self._size, 0)
+        ring, size = self._ring, self._size
+        return end, [ring[index % size] for index in range(start, end)]  # type: ignore[misc]
+
+    async def wait_since(self, seq: int) -> Tuple[int, list[EventPayload]]:
+        """Wait until an event at or after ``seq`` exists, then return :meth:`since`."""
+
+        self._bind_consumer()
+        while self._write_seq <= seq:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.since(seq)
+
+    def _bind_consumer(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._consumer_loop:
+            # asyncio.Event binds to the first loop that waits on it.
+            self._ready = asyncio.Event()
+            self._consumer_loop = loop
+
+    def _notify(self) -> None:
+        loop = self._consumer_loop
+        if loop is None:
+            self._ready.set()
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._ready.set()
+            return
+        try:
+            loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # The consumer's loop is closed; the next reader rebinds.
+            pass
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp: the form every registry column stores and compares.
+
+    ``datetime.utcnow()`` is deprecated; this yields the same value and the
+    same ``isoformat()`` text, so stored rows and expiry comparisons agree.
+    """
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 def _dt_to_iso(value: Optional[datetime]) -> Optional[str]:
     return value.isoformat() if value else None
@@ -57,6 +197,47 @@ _GIT_SHA_UNSET: object = object()
 _GIT_SHA_CACHE: object = _GIT_SHA_UNSET
 
 
+def _read_git_head(repo_root: Path) -> Optional[str]:
+    """Resolve HEAD from the git directory without spawning ``git``.
+
+    Handles loose and packed refs, detached HEADs, and ``.git`` files that
+    point elsewhere (worktrees/submodules). Returns ``None`` for anything
+    else so the caller can fall back to ``git rev-parse``.
+    """
+
+    git_dir = repo_root / ".git"
+    if git_dir.is_file():
+        pointer = git_dir.read_text(encoding="utf-8").strip()
+        if not pointer.startswith("gitdir:"):
+            return None
+        git_dir = (repo_root / pointer[len("gitdir:") :].strip()).resolve()
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref:"):
+        return head or None
+    ref = head[len("ref:") :].strip()
+    # Linked worktrees keep shared refs in the common directory.
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+    for base in (git_dir, common_dir):
+        try:
+            sha = (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if sha:
+            return sha
+    try:
+        packed = (common_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
 def _git_sha() -> Optional[str]:
     global _GIT_SHA_CACHE
     if _GIT_SHA_CACHE is not _GIT_SHA_UNSET:
@@ -67,8 +248,16 @@ def _git_sha() -> Optional[str]:
         _GIT_SHA_CACHE = env_sha
         return env_sha
 
+    repo_root = Path(__file__).resolve().parents[3]
+    try:
+        sha = _read_git_head(repo_root)
+    except OSError:
+        sha = None
+    if sha:
+        _GIT_SHA_CACHE = sha
+        return sha
+
     try:
-        repo_root = Path(__file__).resolve().parents[3]
         sha = subprocess.check_output(
             ["git", "rev-parse", "HEAD"],
             cwd=str(repo_root),
@@ -82,7 +271,7 @@ def _git_sha() -> Optional[str]:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunInfo:
     """Lightweight record of a single run lifecycle."""
 
@@ -95,7 +284,7 @@ class RunInfo:
     step: int = 0
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
-    queue: Optional[asyncio.Queue[EventPayload]] = field(default=None, repr=False)
+    queue: Optional[EventBuffer] = field(default=None, repr=False)
     loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
     git_sha: Optional[str] = None
     seed_save: Optional[str] = None
@@ -108,7 +297,7 @@ class RunInfo:
     latest_summary: Optional[Dict[str, Any]] = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShareToken:
     """Read-only access token for spectator endpoints."""
 
@@ -119,6 +308,32 @@ class ShareToken:
     created_at: datetime
 
 
+_CREATE_RUN_SQL = """
+    INSERT INTO runs (
+      run_id, backend, model, max_steps, ticks_per_step,
+      status, step, created_at, git_sha, seed_save, runtime_save,
+      preserve_save, evaluation_protocol, artifacts_dir, trace_path
+    ) VALUES (?, ?, ?, ?, ?, 'pending', 0, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# One static statement for every set_status() shape: NULL parameters leave
+# their column unchanged, so sqlite3's statement cache always hits.
+# Terminal states are immutable. A worker can only observe a transition after
+# an in-flight call returns, so later lifecycle bookkeeping must not replace an
+# already-terminal outcome.
+_SET_STATUS_SQL = """
+    UPDATE runs
+       SET status = CASE
+                      WHEN ?1 IS NULL OR status IN ('stopped', 'failed', 'completed')
+                      THEN status ELSE ?1
+                    END,
+           step = COALESCE(?2, step),
+           started_at = COALESCE(?3, started_at),
+           ended_at = COALESCE(?4, ended_at)
+     WHERE run_id = ?5
+"""
+
+
 class RunRegistry:
     """Thread-safe run registry with SQLite persistence."""
 
@@ -127,9 +342,22 @@ class RunRegistry:
         self._conn: Optional[sqlite3.Connection] = None
         self._db_lock = threading.Lock()
         self._init_lock = threading.Lock()
-        self._queues: Dict[str, asyncio.Queue[EventPayload]] = {}
+        # Guards only the in-memory per-run state below, so event streaming
+        # and queue lookups never wait behind a SQLite commit on _db_lock.
+        # Lock order: _db_lock, then _state_lock.
+        self._state_lock = threading.Lock()
+        self._queues: Dict[str, EventBuffer] = {}
         self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
         self._stop_events: Dict[str, threading.Event] = {}
+        self._conn_path: Optional[Path] = None
+        self._read_local = threading.local()
+        # Score events are coalesced per run (last writer wins, like the
+        # COALESCE in the UPDATE) and written by one background flusher.
+        self._pending_scores: Dict[str, Tuple[Optional[float], Optional[str]]] = {}
+        self._pending_lock = threading.Lock()
+        self._scores_pending = threading.Event()
+        self._score_flusher: Optional[threading.Thread] = None
+        self._score_flusher_stop = threading.Event()
 
     # ------------------------------------------------------------------
     # SQLite wiring
@@ -158,11 +386,49 @@ class RunRegistry:
                 conn.execute("PRAGMA foreign_keys = ON")
                 conn.execute("PRAGMA journal_mode = WAL")
                 conn.execute("PRAGMA synchronous = NORMAL")
+                conn.execute("PRAGMA busy_timeout = 5000")
+                self._tune_connection(conn)
                 self._ensure_schema(conn)
                 self._mark_interrupted_runs(conn)
+            self._conn_path = path
             self._conn = conn
             return conn
 
+    def _read_conn(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection to the registry database.
+
+        WAL lets readers run alongside the single writer, so read paths query
+        through a per-thread ``mode=ro`` connection instead of queueing behind
+        writes on ``_db_lock``. Each SELECT runs in autocommit and therefore
+        sees every committed write.
+        """
+
+        self._ensure_conn()
+        path = self._conn_path or self._db_path()
+        local = self._read_local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            if local.path == path:
+                return conn
+            conn.close()
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=1.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        self._tune_connection(conn)
+        local.conn = conn
+        local.path = path
+        local.leaderboard = None
+        return conn
+
+    @staticmethod
+    def _tune_connection(conn: sqlite3.Connection) -> None:
+        # Registry connections live for the whole process: keep hot pages in
+        # a larger per-connection cache, map the file instead of read()ing
+        # it, and run the listing sorts in memory.
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA temp_store = MEMORY")
+
     @staticmethod
     def _ensure_schema(conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -248,6 +514,13 @@ class RunRegistry:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_shares_run_expiry ON shares(run_id, expires_at)"
         )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shares_expiry ON shares(expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at)")
+        # Leaderboard order: newest scored runs first, without a temp sort.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_recent_summary ON "
+            "runs(COALESCE(ended_at, created_at)) WHERE summary_json IS NOT NULL"
+        )
 
     @staticmethod
     def _ensure_column(
@@ -259,7 +532,7 @@ class RunRegistry:
 
     @staticmethod
     def _mark_interrupted_runs(conn: sqlite3.Connection) -> None:
-        now = datetime.utcnow().isoformat()
+        now = _utcnow().isoformat()
         conn.execute(
             """
             UPDATE runs
@@ -303,9 +576,9 @@ class RunRegistry:
         evaluation_protocol = validate_evaluation_protocol(evaluation_protocol)
 
         identifier = run_id or uuid.uuid4().hex
-        queue: asyncio.Queue[EventPayload] = asyncio.Queue(maxsize=512)
+        queue = EventBuffer()
 
-        now = datetime.utcnow()
+        now = _utcnow()
         settings = get_settings()
         artifacts_root = Path(settings.ARTIFACTS_DIR).resolve()
         artifacts_dir = artifacts_root / identifier
@@ -316,39 +589,39 @@ class RunRegistry:
         runtime_save = runtime_save or getattr(settings, "FORT_GYM_RUNTIME_SAVE", None)
 
         with self._db_lock:
-            row = conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (identifier,)).fetchone()
-            if row is not None:
-                raise ValueError(f"Run '{identifier}' already registered")
-            conn.execute(
-                """
-                INSERT INTO runs (
-                  run_id, backend, model, max_steps, ticks_per_step,
-                  status, step, created_at, git_sha, seed_save, runtime_save,
-                  preserve_save, evaluation_protocol, artifacts_dir, trace_path
-                ) VALUES (?, ?, ?, ?, ?, 'pending', 0, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    identifier,
-                    backend,
-                    model,
-                    int(max_steps),
-                    int(ticks_per_step),
-                    now.isoformat(),
-                    git_sha,
-                    seed_save,
-                    runtime_save,
-                    1 if preserve_save else 0,
-                    evaluation_protocol,
-                    str(artifacts_dir),
-                    str(trace_path),
-                ),
-            )
+            try:
+                conn.execute(
+                    _CREATE_RUN_SQL,
+                    (
+                        identifier,
+                        backend,
+                        model,
+                        int(max_steps),
+                        int(ticks_per_step),
+                        now.isoformat(),
+                        git_sha,
+                        seed_save,
+                        runtime_save,
+                        1 if preserve_save else 0,
+                        evaluation_protocol,
+                        str(artifacts_dir),
+                        str(trace_path),
+                    ),
+                )
+            except sqlite3.IntegrityError as exc:
+                conn.rollback()
+                # The run_id primary key is the duplicate check; any other
+                # constraint failure is a real error and propagates as is.
+                if str(exc) != "UNIQUE constraint failed: runs.run_id":
+                    raise
+                raise ValueError(f"Run '{identifier}' already registered") from None
             conn.commit()
 
-            self._queues[identifier] = queue
-            self._stop_events[identifier] = threading.Event()
-            if loop is not None:
-                self._loops[identifier] = loop
+            with self._state_lock:
+                self._queues[identifier] = queue
+                self._stop_events[identifier] = threading.Event()
+                if loop is not None:
+                    self._loops[identifier] = loop
 
         return RunInfo(
             run_id=identifier,
@@ -368,24 +641,38 @@ class RunRegistry:
         )
 
     def get(self, run_id: str) -> Optional[RunInfo]:
-        conn = self._ensure_conn()
-        with self._db_lock:
-            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
-            if row is None:
-                return None
+        row = self._read_conn().execute(
+            "SELECT * FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._state_lock:
             queue = self._queues.get(run_id)
             loop = self._loops.get(run_id)
         return self._row_to_runinfo(row, queue=queue, loop=loop)
 
-    def list(self) -> list[RunInfo]:
-        conn = self._ensure_conn()
-        with self._db_lock:
-            rows = conn.execute("SELECT * FROM runs ORDER BY created_at DESC").fetchall()
+    def list(self, *, include_summary: bool = True) -> list[RunInfo]:
+        """Return every run, newest first.
+
+        Listing callers that only need the score can pass
+        ``include_summary=False`` to skip reading and decoding each stored
+        summary; ``metadata["last_score"]`` still carries the summary's total
+        score.
+        """
+
+        columns = "*" if include_summary else _RUN_LISTING_COLUMNS
+        rows = self._read_conn().execute(
+            f"SELECT {columns} FROM runs ORDER BY created_at DESC"
+        ).fetchall()
+        with self._state_lock:
             queues = dict(self._queues)
             loops = dict(self._loops)
         return [
             self._row_to_runinfo(
-                row, queue=queues.get(row["run_id"]), loop=loops.get(row["run_id"])
+                row,
+                queue=queues.get(row["run_id"]),
+                loop=loops.get(row["run_id"]),
+                include_summary=include_summary,
             )
             for row in rows
         ]
@@ -415,32 +702,20 @@ class RunRegistry:
         started_at: Optional[datetime] = None,
         ended_at: Optional[datetime] = None,
     ) -> None:
-        conn = self._ensure_conn()
-        updates: list[str] = []
-        params: list[object] = []
-        if status is not None:
-            # Terminal states are immutable. A worker can only observe a
-            # transition after an in-flight call returns, so later lifecycle
-            # bookkeeping must not replace an already-terminal outcome.
-            updates.append(
-                "status = CASE WHEN status IN ('stopped', 'failed', 'completed') "
-                "THEN status ELSE ? END"
-            )
-            params.append(status)
-        if step is not None:
-            updates.append("step = ?")
-            params.append(int(step))
-        if started_at is not None:
-            updates.append("started_at = ?")
-            params.append(_dt_to_iso(started_at))
-        if ended_at is not None:
-            updates.append("ended_at = ?")
-            params.append(_dt_to_iso(ended_at))
-        if not updates:
+        if status is None and step is None and started_at is None and ended_at is None:
             return
-        params.append(run_id)
+        conn = self._ensure_conn()
         with self._db_lock:
-            conn.execute(f"UPDATE runs SET {', '.join(updates)} WHERE run_id = ?", params)
+            conn.execute(
+                _SET_STATUS_SQL,
+                (
+                    status,
+                    int(step) if step is not None else None,
+                    _dt_to_iso(started_at),
+                    _dt_to_iso(ended_at),
+                    run_id,
+                ),
+            )
             conn.commit()
 
     def record_terminal_failure(
@@ -511,7 +786,7 @@ class RunRegistry:
             conn.commit()
 
     def bind_loop(self, run_id: str, loop: asyncio.AbstractEventLoop) -> None:
-        with self._db_lock:
+        with self._state_lock:
             self._loops[run_id] = loop
 
     def record_cleanup_completed(self, run_id: str, *, completed_at: datetime) -> None:
@@ -552,7 +827,8 @@ class RunRegistry:
             if row is None:
                 raise KeyError(run_id)
             current_status = str(row["status"])
-            event = self._stop_events.get(run_id)
+            with self._state_lock:
+                event = self._stop_events.get(run_id)
             if current_status in {"stopped", "failed", "completed"}:
                 if event is not None:
                     event.clear()
@@ -591,36 +867,39 @@ class RunRegistry:
             ).fetchone()
             if row is None or str(row["status"]) in {"stopped", "failed", "completed"}:
                 return False
-            event = self._stop_events.get(run_id)
-            if event is None:
-                event = threading.Event()
-                self._stop_events[run_id] = event
+            with self._state_lock:
+                event = self._stop_events.get(run_id)
+                if event is None:
+                    event = threading.Event()
+                    self._stop_events[run_id] = event
             conn.execute(
                 """
                 UPDATE runs
                    SET stop_requested_at = COALESCE(stop_requested_at, ?)
                  WHERE run_id = ?
                 """,
-                (datetime.utcnow().isoformat(), run_id),
+                (_utcnow().isoformat(), run_id),
             )
             conn.commit()
             event.set()
         return True
 
     def stop_requested(self, run_id: str) -> bool:
-        conn = self._ensure_conn()
-        with self._db_lock:
+        with self._state_lock:
             event = self._stop_events.get(run_id)
-            row = conn.execute(
-                "SELECT stop_requested_at FROM runs WHERE run_id = ?",
-                (run_id,),
-            ).fetchone()
+        if event is not None and event.is_set():
+            return True
+        row = self._read_conn().execute(
+            "SELECT stop_requested_at FROM runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
         return bool((event and event.is_set()) or (row and row["stop_requested_at"]))
 
     def clear_stop(self, run_id: str) -> None:
         conn = self._ensure_conn()
         with self._db_lock:
-            event = self._stop_events.get(run_id)
+            with self._state_lock:
+                event = self._stop_events.get(run_id)
             if event is not None:
                 event.clear()
             conn.execute(
@@ -629,12 +908,12 @@ class RunRegistry:
             )
             conn.commit()
 
-    def get_queue(self, run_id: str) -> Optional[asyncio.Queue[EventPayload]]:
-        with self._db_lock:
+    def get_queue(self, run_id: str) -> Optional[EventBuffer]:
+        with self._state_lock:
             return self._queues.get(run_id)
 
     def append_event(self, run_id: str, event: EventPayload) -> None:
-        with self._db_lock:
+        with self._state_lock:
             queue = self._queues.get(run_id)
             loop = self._loops.get(run_id)
 
@@ -652,25 +931,29 @@ class RunRegistry:
             if score_value is None:
                 score_value = data.get("value")
             milestones = data.get("milestones")
-            self._update_score(run_id, score_value, milestones)
+            if score_value is not None or milestones is not None:
+                self._update_score(run_id, score_value, milestones)
 
         def push() -> None:
+            # Resolve the queue when the callback runs, not when it was
+            # scheduled: a queue dropped or replaced in between must not
+            # receive (or evict from) a stale stream.
+            with self._state_lock:
+                target = self._queues.get(run_id)
+            if target is not None:
+                target.put_nowait(payload)
+
+        if loop is not None and loop.is_running():
             try:
-                queue.put_nowait(payload)
-            except asyncio.QueueFull:
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    return
-                queue.put_nowait(payload)
-
-        if loop and loop.is_running():
-            loop.call_soon_threadsafe(push)
-        else:
-            push()
+                loop.call_soon_threadsafe(push)
+                return
+            except RuntimeError:
+                # The loop closed after is_running(); no callback will run,
+                # so treat it like an unbound loop.
+                pass
+        push()
 
     def _update_score(self, run_id: str, score_value: object, milestones: object) -> None:
-        conn = self._ensure_conn()
         score: Optional[float] = None
         if score_value is not None:
             try:
@@ -683,21 +966,113 @@ class RunRegistry:
                 milestones_json = json.dumps(milestones)
             except TypeError:
                 milestones_json = None
+        if score is None and milestones_json is None:
+            return
+        with self._pending_lock:
+            previous = self._pending_scores.get(run_id)
+            if previous is not None:
+                if score is None:
+                    score = previous[0]
+                if milestones_json is None:
+                    milestones_json = previous[1]
+            self._pending_scores[run_id] = (score, milestones_json)
+            if self._score_flusher is None:
+                # Each flusher gets its own stop event, so one started after
+                # a stop is not told to exit by the earlier request.
+                self._score_flusher_stop = threading.Event()
+                self._score_flusher = threading.Thread(
+                    target=self._score_flush_loop,
+                    args=(self._score_flusher_stop,),
+                    name="run-registry-scores",
+                    daemon=True,
+                )
+                self._score_flusher.start()
+        self._scores_pending.set()
+
+    def _score_flush_loop(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            self._scores_pending.wait()
+            if stop.wait(SCORE_FLUSH_INTERVAL_S):
+                return
+            try:
+                self.flush_scores()
+            except sqlite3.Error:
+                # Keep flushing later batches; the final summary write
+                # carries the authoritative score regardless.
+                continue
+
+    def _stop_score_flusher(self) -> None:
+        """Stop and join the background flusher; queued scores stay pending."""
+
+        with self._pending_lock:
+            flusher = self._score_flusher
+            stop = self._score_flusher_stop
+            self._score_flusher = None
+        if flusher is None:
+            return
+        stop.set()
+        self._scores_pending.set()
+        flusher.join()
+        with self._pending_lock:
+            if not self._pending_scores:
+                self._scores_pending.clear()
+
+    def _take_pending_scores(
+        self, run_id: Optional[str] = None
+    ) -> list[Tuple[Optional[float], Optional[str], str]]:
+        with self._pending_lock:
+            if run_id is not None:
+                entry = self._pending_scores.pop(run_id, None)
+                return [] if entry is None else [(entry[0], entry[1], run_id)]
+            batch = self._pending_scores
+            self._pending_scores = {}
+            self._scores_pending.clear()
+        return [(score, milestones, rid) for rid, (score, milestones) in batch.items()]
+
+    @staticmethod
+    def _write_scores(
+        conn: sqlite3.Connection, rows: list[Tuple[Optional[float], Optional[str], str]]
+    ) -> None:
+        conn.executemany(
+            """
+            UPDATE runs
+               SET last_score = COALESCE(?, last_score),
+                   milestones_json = COALESCE(?, milestones_json)
+             WHERE run_id = ?
+            """,
+            rows,
+        )
+
+    def flush_scores(self) -> None:
+        """Write every coalesced score event to SQLite in one transaction."""
+
+        conn = self._ensure_conn()
         with self._db_lock:
-            if score is None and milestones_json is None:
+            # Take the batch under the write lock: a batch taken before it
+            # could land after set_summary() and overwrite the final score.
+            rows = self._take_pending_scores()
+            if not rows:
                 return
-            sets: list[str] = []
-            params: list[object] = []
-            if score is not None:
-                sets.append("last_score = ?")
-                params.append(score)
-            if milestones_json is not None:
-                sets.append("milestones_json = ?")
-                params.append(milestones_json)
-            params.append(run_id)
-            conn.execute(f"UPDATE runs SET {', '.join(sets)} WHERE run_id = ?", params)
+            self._write_scores(conn, rows)
             conn.commit()
 
+    def close(self) -> None:
+        """Stop the score flusher, write what it had queued, and close the writer.
+
+        ``PRAGMA optimize`` runs first so the query planner statistics the
+        process gathered are kept for the next start.
+        """
+
+        self._stop_score_flusher()
+        if self._conn is None:
+            return
+        self.flush_scores()
+        with self._db_lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+
     def set_summary(self, run_id: str, summary: Dict[str, Any]) -> None:
         conn = self._ensure_conn()
         summary_json = json.dumps(summary)
@@ -707,6 +1082,9 @@ class RunRegistry:
         milestones_json = json.dumps(milestones) if milestones is not None else None
 
         with self._db_lock:
+            # Land any queued score event first so it cannot overwrite the
+            # summary's score when the flusher runs later.
+            self._write_scores(conn, self._take_pending_scores(run_id))
             conn.execute(
                 """
                 UPDATE runs
@@ -740,17 +1118,20 @@ class RunRegistry:
     ) -> ShareToken:
         conn = self._ensure_conn()
         token = secrets.token_urlsafe(24)
-        resolved_scope = {str(item) for item in (scope or {"live", "replay", "export"})}
+        resolved_scope = {str(item) for item in (scope or _FULL_SHARE_SCOPE)}
+        now = _utcnow()
         expires_at = (
-            datetime.utcnow() + timedelta(seconds=int(ttl_seconds))
-            if ttl_seconds is not None
-            else None
+            now + timedelta(seconds=int(ttl_seconds)) if ttl_seconds is not None else None
         )
 
         with self._db_lock:
             exists = conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
             if exists is None:
                 raise KeyError(run_id)
+            # Every read already filters expired tokens out; dropping them here
+            # keeps public listings from rescanning them. The expiry index makes
+            # this a range delete over just the rows that have expired.
+            conn.execute("DELETE FROM shares WHERE expires_at <= ?", (now.isoformat(),))
             conn.execute(
                 """
                 INSERT INTO shares (token, run_id, scope_json, expires_at, created_at)
@@ -761,7 +1142,7 @@ class RunRegistry:
                     run_id,
                     json.dumps(sorted(resolved_scope)),
                     _dt_to_iso(expires_at),
-                    datetime.utcnow().isoformat(),
+                    now.isoformat(),
                 ),
             )
             conn.commit()
@@ -771,67 +1152,76 @@ class RunRegistry:
             run_id=run_id,
             scope=resolved_scope,
             expires_at=expires_at,
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
 
     def get_share(self, token: str) -> Optional[ShareToken]:
-        conn = self._ensure_conn()
-        now = datetime.utcnow().isoformat()
-        with self._db_lock:
-            row = conn.execute(
-                """
-                SELECT token, run_id, scope_json, expires_at, created_at
-                  FROM shares
-                 WHERE token = ?
-                   AND (expires_at IS NULL OR expires_at > ?)
-                """,
-                (token, now),
-            ).fetchone()
+        now = _utcnow().isoformat()
+        row = self._read_conn().execute(
+            """
+            SELECT token, run_id, scope_json, expires_at, created_at
+              FROM shares
+             WHERE token = ?
+               AND (expires_at IS NULL OR expires_at > ?)
+            """,
+            (token, now),
+        ).fetchone()
         if row is None:
             return None
         return self._row_to_sharetoken(row)
 
-    def list_public(self) -> list[Tuple[RunInfo, ShareToken]]:
-        conn = self._ensure_conn()
-        now = datetime.utcnow().isoformat()
-        with self._db_lock:
-            rows = conn.execute(
-                """
-                SELECT
-                  r.*,
-                  s.token AS share_token,
-                  s.scope_json AS share_scope_json,
-                  s.expires_at AS share_expires_at,
-                  s.created_at AS share_created_at
-                FROM shares s
-                JOIN runs r ON r.run_id = s.run_id
-                WHERE s.expires_at IS NULL OR s.expires_at > ?
+    def list_public(
+        self, *, include_summary: bool = True
+    ) -> list[Tuple[RunInfo, ShareToken]]:
+        """Return every run with an unexpired share, paired with its best share.
+
+        Shares are read on their own and each shared run row is loaded once,
+        rather than joining so every share repeats the full run row
+        (``summary_json`` included).
+        """
+
+        conn = self._read_conn()
+        now = _utcnow().isoformat()
+        share_rows = conn.execute(
+            """
+            SELECT token, run_id, scope_json, expires_at, created_at
+              FROM shares
+             WHERE expires_at IS NULL OR expires_at > ?
+            """,
+            (now,),
+        ).fetchall()
+        shares_by_run: Dict[str, list[ShareToken]] = {}
+        for row in share_rows:
+            share = self._row_to_sharetoken(row)
+            shares_by_run.setdefault(share.run_id, []).append(share)
+        if not shares_by_run:
+            return []
+
+        columns = "*" if include_summary else _RUN_LISTING_COLUMNS
+        run_rows = {
+            str(row["run_id"]): row
+            for row in conn.execute(
+                f"""
+                SELECT {columns} FROM runs r
+                 WHERE EXISTS (
+                   SELECT 1 FROM shares s
+                    WHERE s.run_id = r.run_id
+                      AND (s.expires_at IS NULL OR s.expires_at > ?)
+                 )
                 """,
                 (now,),
-            ).fetchall()
-
-        grouped: Dict[str, Tuple[sqlite3.Row, list[ShareToken]]] = {}
-        for row in rows:
-            run_id = str(row["run_id"])
-            share = ShareToken(
-                token=str(row["share_token"]),
-                run_id=run_id,
-                scope=set(json.loads(row["share_scope_json"])),
-                expires_at=_dt_from_iso(row["share_expires_at"]),
-                created_at=_dt_from_iso(row["share_created_at"]) or datetime.utcnow(),
             )
-            item = grouped.get(run_id)
-            if item is None:
-                grouped[run_id] = (row, [share])
-            else:
-                item[1].append(share)
+        }
 
         items: list[Tuple[RunInfo, ShareToken]] = []
-        for run_row, shares in grouped.values():
+        for run_id, shares in shares_by_run.items():
+            run_row = run_rows.get(run_id)
             share = self._select_share(shares)
-            if share is None:
+            if run_row is None or share is None:
                 continue
-            items.append((self._row_to_runinfo(run_row), share))
+            items.append(
+                (self._row_to_runinfo(run_row, include_summary=include_summary), share)
+            )
         return items
 
     def list_public_for_protocol(
@@ -839,67 +1229,50 @@ class RunRegistry:
     ) -> Tuple[list[Tuple[RunInfo, ShareToken]], bool]:
         """Return a bounded public cohort for one exact protocol label."""
 
-        self._ensure_conn()
-        now = datetime.utcnow().isoformat()
-        read_conn = sqlite3.connect(
-            f"{self._db_path().resolve().as_uri()}?mode=ro", uri=True, timeout=1.0
-        )
-        read_conn.row_factory = sqlite3.Row
-        try:
-            read_conn.execute("PRAGMA query_only = ON")
-            rows = read_conn.execute(
-                """
-                WITH protocol_runs AS (
-                    SELECT r.*
-                      FROM runs r
-                     WHERE r.evaluation_protocol = ?
-                       AND EXISTS (
-                           SELECT 1
-                             FROM shares active_share
-                            WHERE active_share.run_id = r.run_id
-                              AND (
-                                  active_share.expires_at IS NULL
-                                  OR active_share.expires_at > ?
-                              )
-                       )
-                     ORDER BY r.run_id
-                     LIMIT ?
-                )
-                SELECT
-                  r.*,
-                  s.token AS share_token,
-                  s.scope_json AS share_scope_json,
-                  s.expires_at AS share_expires_at,
-                  s.created_at AS share_created_at
-                  FROM protocol_runs r
-                  JOIN shares s ON s.run_id = r.run_id
-                 WHERE s.expires_at IS NULL OR s.expires_at > ?
-                """,
-                (evaluation_protocol, now, int(limit) + 1, now),
-            ).fetchall()
-        finally:
-            read_conn.close()
-
-        grouped: Dict[str, Tuple[sqlite3.Row, list[ShareToken]]] = {}
-        for row in rows:
-            run_id = str(row["run_id"])
-            share = ShareToken(
-                token=str(row["share_token"]),
-                run_id=run_id,
-                scope=set(json.loads(row["share_scope_json"])),
-                expires_at=_dt_from_iso(row["share_expires_at"]),
-                created_at=_dt_from_iso(row["share_created_at"]) or datetime.utcnow(),
-            )
-            item = grouped.get(run_id)
-            if item is None:
-                grouped[run_id] = (row, [share])
-            else:
-                item[1].append(share)
+        now = _utcnow().isoformat()
+        read_conn = self._read_conn()
+        rows = read_conn.execute(
+            """
+            SELECT r.*
+              FROM runs r
+             WHERE r.evaluation_protocol = ?
+               AND EXISTS (
+                   SELECT 1
+                     FROM shares active_share
+                    WHERE active_share.run_id = r.run_id
+                      AND (
+                          active_share.expires_at IS NULL
+                          OR active_share.expires_at > ?
+                      )
+               )
+             ORDER BY r.run_id
+             LIMIT ?
+            """,
+            (evaluation_protocol, now, int(limit) + 1),
+        ).fetchall()
+        truncated = len(rows) > limit
+        run_rows = rows[:limit]
+        if not run_rows:
+            return [], truncated
+
+        # Shares are fetched on their own, so a run with several tokens is
+        # not repeated (summary_json included) once per token.
+        shares_by_run: Dict[str, list[ShareToken]] = {}
+        for row in read_conn.execute(
+            """
+            SELECT token, run_id, scope_json, expires_at, created_at
+              FROM shares
+             WHERE run_id IN (SELECT value FROM json_each(?))
+               AND (expires_at IS NULL OR expires_at > ?)
+            """,
+            (json.dumps([str(row["run_id"]) for row in run_rows]), now),
+        ):
+            share = self._row_to_sharetoken(row)
+            shares_by_run.setdefault(share.run_id, []).append(share)
 
-        truncated = len(grouped) > limit
         items: list[Tuple[RunInfo, ShareToken]] = []
-        for run_row, shares in list(grouped.values())[:limit]:
-            share = self._select_share(shares)
+        for run_row in run_rows:
+            share = self._select_share(shares_by_run.get(str(run_row["run_id"]), []))
             if share is not None:
                 items.append((self._row_to_runinfo(run_row), share))
         return items, truncated
@@ -921,8 +1294,7 @@ class RunRegistry:
         files are intentionally outside this query path.
         """
 
-        self._ensure_conn()
-        now = datetime.utcnow().isoformat()
+        now = _utcnow().isoformat()
         where = [
             "r.backend = 'dfhack'",
             "EXISTS (SELECT 1 FROM shares s "
@@ -969,44 +1341,37 @@ class RunRegistry:
             COALESCE(r.ended_at, r.started_at, r.created_at) DESC,
             r.run_id DESC
         """
-        read_conn = sqlite3.connect(
-            f"{self._db_path().resolve().as_uri()}?mode=ro", uri=True, timeout=1.0
-        )
-        read_conn.row_factory = sqlite3.Row
-        try:
-            read_conn.execute("PRAGMA query_only = ON")
-            total_row = read_conn.execute(
-                f"SELECT COUNT(*) AS total FROM runs r WHERE {where_sql}", params
-            ).fetchone()
-            rows = read_conn.execute(
-                f"""
-                WITH page_runs AS (
-                    SELECT r.*
-                      FROM runs r
-                     WHERE {where_sql}
-                     ORDER BY {ordering}
-                     LIMIT ? OFFSET ?
-                )
-                SELECT
-                  r.*,
-                  s.token AS share_token,
-                  s.scope_json AS share_scope_json,
-                  s.expires_at AS share_expires_at,
-                  s.created_at AS share_created_at
-                  FROM page_runs r
-                  JOIN shares s ON s.run_id = r.run_id
-                 WHERE (s.expires_at IS NULL OR s.expires_at > ?)
-                   AND 2 = (
-                     SELECT COUNT(DISTINCT scope.value)
-                       FROM json_each(s.scope_json) scope
-                      WHERE scope.value IN ('replay', 'export')
-                   )
-                 ORDER BY {ordering}, s.created_at ASC
-                """,
-                [*params, int(limit), int(offset), now],
-            ).fetchall()
-        finally:
-            read_conn.close()
+        read_conn = self._read_conn()
+        total_row = read_conn.execute(
+            f"SELECT COUNT(*) AS total FROM runs r WHERE {where_sql}", params
+        ).fetchone()
+        rows = read_conn.execute(
+            f"""
+            WITH page_runs AS (
+                SELECT r.*
+                  FROM runs r
+                 WHERE {where_sql}
+                 ORDER BY {ordering}
+                 LIMIT ? OFFSET ?
+            )
+            SELECT
+              r.*,
+              s.token AS share_token,
+              s.scope_json AS share_scope_json,
+              s.expires_at AS share_expires_at,
+              s.created_at AS share_created_at
+              FROM page_runs r
+              JOIN shares s ON s.run_id = r.run_id
+             WHERE (s.expires_at IS NULL OR s.expires_at > ?)
+               AND 2 = (
+                 SELECT COUNT(DISTINCT scope.value)
+                   FROM json_each(s.scope_json) scope
+                  WHERE scope.value IN ('replay', 'export')
+               )
+             ORDER BY {ordering}, s.created_at ASC
+            """,
+            [*params, int(limit), int(offset), now],
+        ).fetchall()
 
         shares_by_run: Dict[str, list[ShareToken]] = {}
         run_rows: Dict[str, sqlite3.Row] = {}
@@ -1022,7 +1387,7 @@ class RunRegistry:
                     run_id=run_id,
                     scope=set(json.loads(row["share_scope_json"])),
                     expires_at=_dt_from_iso(row["share_expires_at"]),
-                    created_at=_dt_from_iso(row["share_created_at"]) or datetime.utcnow(),
+                    created_at=_dt_from_iso(row["share_created_at"]) or _utcnow(),
                 )
             )
 
@@ -1078,23 +1443,24 @@ class RunRegistry:
 
     @staticmethod
     def _select_share(tokens: Iterable[ShareToken]) -> Optional[ShareToken]:
-        comprehensive: Optional[ShareToken] = None
         evidence: Optional[ShareToken] = None
         replay: Optional[ShareToken] = None
         preferred: Optional[ShareToken] = None
         fallback: Optional[ShareToken] = None
         for share in tokens:
-            if {"live", "replay", "export"}.issubset(share.scope) and comprehensive is None:
-                comprehensive = share
-            if {"replay", "export"}.issubset(share.scope) and evidence is None:
+            scope = share.scope
+            if _FULL_SHARE_SCOPE <= scope:
+                # Nothing outranks a comprehensive token.
+                return share
+            if evidence is None and _EVIDENCE_SHARE_SCOPE <= scope:
                 evidence = share
-            if "replay" in share.scope and replay is None:
+            if replay is None and "replay" in scope:
                 replay = share
-            if "live" in share.scope and preferred is None:
+            if preferred is None and "live" in scope:
                 preferred = share
             if fallback is None:
                 fallback = share
-        return comprehensive or evidence or replay or preferred or fallback
+        return evidence or replay or preferred or fallback
 
     def public_leaderboard(self, limit: int = 50) -> list[Dict[str, Any]]:
         """Return per-(model, score_version, seed_save) aggregates.
@@ -1105,25 +1471,61 @@ class RunRegistry:
         so every row here is scoped to one (model, score_version, seed_save)
         bucket. Runs with no recorded ``score_version`` predate the field and
         are bucketed as version 1.
+
+        Scoreboards poll this far more often than summaries land, so the
+        result is cached per reader thread until another connection commits
+        (``PRAGMA data_version``) or the next share in the table expires.
         """
 
-        conn = self._ensure_conn()
-        now = datetime.utcnow().isoformat()
-        with self._db_lock:
-            rows = conn.execute(
-                """
-                SELECT r.run_id, r.model, r.summary_json, r.seed_save,
-                       s.token AS share_token, s.scope_json AS share_scope_json,
-                       s.expires_at AS share_expires_at, s.created_at AS share_created_at
-                  FROM runs r
-                  JOIN shares s ON s.run_id = r.run_id
-                 WHERE (s.expires_at IS NULL OR s.expires_at > ?)
-                   AND r.summary_json IS NOT NULL
-                 ORDER BY COALESCE(r.ended_at, r.created_at) DESC
-                 LIMIT ?
-                """,
-                (now, int(limit)),
-            ).fetchall()
+        conn = self._read_conn()
+        now = _utcnow().isoformat()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        cached = self._read_local.leaderboard
+        if cached is not None:
+            version, cached_limit, valid_until, leaderboard = cached
+            if (
+                version == data_version
+                and cached_limit == int(limit)
+                and (valid_until is None or now < valid_until)
+            ):
+                return [dict(item) for item in leaderboard]
+        next_expiry = conn.execute(
+            "SELECT MIN(expires_at) FROM shares WHERE expires_at > ?", (now,)
+        ).fetchone()[0]
+        leaderboard = self._compute_public_leaderboard(conn, now, int(limit))
+        self._read_local.leaderboard = (data_version, int(limit), next_expiry, leaderboard)
+        return [dict(item) for item in leaderboard]
+
+    def _compute_public_leaderboard(
+        self, conn: sqlite3.Connection, now: str, limit: int
+    ) -> list[Dict[str, Any]]:
+        # Pull just the three summary fields the board needs; decoding whole
+        # summaries in Python dominated this query. Malformed summaries come
+        # back with summary_ok = 0 and are skipped, as before.
+        rows = conn.execute(
+            """
+            SELECT r.run_id, r.model, r.seed_save,
+                   json_valid(r.summary_json) AS summary_ok,
+                   CASE WHEN json_valid(r.summary_json)
+                        THEN json_extract(r.summary_json, '$.score_version') END
+                     AS summary_score_version,
+                   CASE WHEN json_valid(r.summary_json)
+                        THEN json_extract(r.summary_json, '$.total_score') END
+                     AS summary_total_score,
+                   CASE WHEN json_valid(r.summary_json)
+                        THEN json_extract(r.summary_json, '$.survival_score') END
+                     AS summary_survival_score,
+                   s.token AS share_token, s.scope_json AS share_scope_json,
+                   s.expires_at AS share_expires_at, s.created_at AS share_created_at
+              FROM runs r
+              JOIN shares s ON s.run_id = r.run_id
+             WHERE (s.expires_at IS NULL OR s.expires_at > ?)
+               AND r.summary_json IS NOT NULL
+             ORDER BY COALESCE(r.ended_at, r.created_at) DESC
+             LIMIT ?
+            """,
+            (now, limit),
+        ).fetchall()
 
         # A run may carry more than one live share token; dedupe to one row
         # per run_id and collect all its shares for `_select_share`.
@@ -1142,18 +1544,16 @@ class RunRegistry:
                     run_id=run_id,
                     scope=scopes,
                     expires_at=_dt_from_iso(row["share_expires_at"]),
-                    created_at=_dt_from_iso(row["share_created_at"]) or datetime.utcnow(),
+                    created_at=_dt_from_iso(row["share_created_at"]) or _utcnow(),
                 )
             )
 
         aggregates: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
         for run_id, row in run_rows.items():
-            model = str(row["model"])
-            try:
-                summary = json.loads(row["summary_json"])
-            except Exception:
+            if not row["summary_ok"]:
                 continue
-            score_version = _normalize_score_version(summary.get("score_version"))
+            model = str(row["model"])
+            score_version = _normalize_score_version(row["summary_score_version"])
             seed_save = str(row["seed_save"]) if row["seed_save"] else "unspecified"
             key = (model, score_version, seed_save)
             stats = aggregates.setdefault(
@@ -1169,10 +1569,14 @@ class RunRegistry:
                     "best_token": None,
                 },
             )
-            score = float(summary.get("total_score", 0.0))
+            total_score = row["summary_total_score"]
+            survival_score = row["summary_survival_score"]
+            score = float(total_score) if total_score is not None else 0.0
             stats["runs"] += 1
             stats["total_score"] += score
-            stats["survival_total"] += float(summary.get("survival_score", 0.0))
+            stats["survival_total"] += (
+                float(survival_score) if survival_score is not None else 0.0
+            )
             if stats["best_score"] is None or score >= stats["best_score"]:
                 stats["best_score"] = score
                 share = self._select_share(shares_by_run.get(run_id, []))
@@ -1215,8 +1619,8 @@ class RunRegistry:
         alongside the existing `model`/`git_sha`/`backend` grouping.
         """
 
-        conn = self._ensure_conn()
-        now_dt = datetime.utcnow()
+        conn = self._read_conn()
+        now_dt = _utcnow()
         since_dt = now_dt - timedelta(days=max(1, int(days)))
         now = now_dt.isoformat()
         since = since_dt.isoformat()
@@ -1251,8 +1655,7 @@ class RunRegistry:
             ORDER BY r.ended_at ASC
         """
 
-        with self._db_lock:
-            rows = conn.execute(query, params).fetchall()
+        rows = conn.execute(query, params).fetchall()
 
         runs: Dict[str, sqlite3.Row] = {}
         shares_by_run: Dict[str, list[ShareToken]] = {}
@@ -1269,7 +1672,7 @@ class RunRegistry:
                     run_id=run_id,
                     scope=scopes,
                     expires_at=_dt_from_iso(row["share_expires_at"]),
-                    created_at=_dt_from_iso(row["share_created_at"]) or datetime.utcnow(),
+                    created_at=_dt_from_iso(row["share_created_at"]) or _utcnow(),
                 )
             )
 
@@ -1350,58 +1753,72 @@ class RunRegistry:
         self,
         row: sqlite3.Row,
         *,
-        queue: Optional[asyncio.Queue[EventPayload]] = None,
+        queue: Optional[EventBuffer] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        include_summary: bool = True,
     ) -> RunInfo:
+        # sqlite3.Row resolves names by scanning its columns on every lookup;
+        # one dict copy makes the twenty-odd reads below hash lookups.
+        fields = dict(zip(row.keys(), row))
         metadata: Dict[str, Any] = {}
-        if row["last_score"] is not None:
-            metadata["last_score"] = float(row["last_score"])
-        if row["milestones_json"]:
+        last_score = fields["last_score"]
+        milestones_json = fields["milestones_json"]
+        with self._pending_lock:
+            pending = self._pending_scores.get(str(fields["run_id"]))
+        if pending is not None:
+            # Not flushed yet: report what a flushed row would hold.
+            last_score = pending[0] if pending[0] is not None else last_score
+            milestones_json = pending[1] or milestones_json
+        if last_score is not None:
+            metadata["last_score"] = float(last_score)
+        if milestones_json:
             try:
-                metadata["milestones"] = json.loads(row["milestones_json"])
+                metadata["milestones"] = json.loads(milestones_json)
             except Exception:
                 pass
-        if row["survival_score"] is not None:
+        if fields["survival_score"] is not None:
             try:
-                metadata["survived"] = float(row["survival_score"]) > 0
+                metadata["survived"] = float(fields["survival_score"]) > 0
             except Exception:
                 pass
-        if row["terminal_reason_json"]:
+        if fields["terminal_reason_json"]:
             try:
-                metadata["terminal_reason"] = json.loads(row["terminal_reason_json"])
+                metadata["terminal_reason"] = json.loads(fields["terminal_reason_json"])
             except Exception:
                 pass
-        if row["stop_requested_at"]:
-            metadata["stop_requested_at"] = str(row["stop_requested_at"])
-        if row["cleanup_completed_at"]:
-            metadata["cleanup_completed_at"] = str(row["cleanup_completed_at"])
+        if fields["stop_requested_at"]:
+            metadata["stop_requested_at"] = str(fields["stop_requested_at"])
+        if fields["cleanup_completed_at"]:
+            metadata["cleanup_completed_at"] = str(fields["cleanup_completed_at"])
+        if queue is not None and queue.dropped:
+            metadata["dropped_events"] = queue.dropped
 
         latest_summary: Optional[Dict[str, Any]] = None
-        if row["summary_json"]:
+        if include_summary and fields["summary_json"]:
             try:
-                latest_summary = json.loads(row["summary_json"])
+                latest_summary = json.loads(fields["summary_json"])
             except Exception:
                 latest_summary = None
 
         return RunInfo(
-            run_id=str(row["run_id"]),
-            backend=str(row["backend"]),
-            model=str(row["model"]),
-            max_steps=int(row["max_steps"]),
-            ticks_per_step=int(row["ticks_per_step"]),
-            status=str(row["status"]),
-            step=int(row["step"]),
-            started_at=_dt_from_iso(row["started_at"]),
-            ended_at=_dt_from_iso(row["ended_at"]),
+            run_id=str(fields["run_id"]),
+            backend=str(fields["backend"]),
+            model=str(fields["model"]),
+            max_steps=int(fields["max_steps"]),
+            ticks_per_step=int(fields["ticks_per_step"]),
+            status=str(fields["status"]),
+            step=int(fields["step"]),
+            started_at=_dt_from_iso(fields["started_at"]),
+            ended_at=_dt_from_iso(fields["ended_at"]),
             queue=queue,
             loop=loop,
-            git_sha=row["git_sha"],
-            seed_save=row["seed_save"],
-            runtime_save=row["runtime_save"],
-            preserve_save=bool(row["preserve_save"]),
-            evaluation_protocol=row["evaluation_protocol"],
-            artifacts_dir=row["artifacts_dir"],
-            trace_path=row["trace_path"],
+            git_sha=fields["git_sha"],
+            seed_save=fields["seed_save"],
+            runtime_save=fields["runtime_save"],
+            preserve_save=bool(fields["preserve_save"]),
+            evaluation_protocol=fields["evaluation_protocol"],
+            artifacts_dir=fields["artifacts_dir"],
+            trace_path=fields["trace_path"],
             metadata=metadata,
             latest_summary=latest_summary,
         )
@@ -1417,7 +1834,7 @@ class RunRegistry:
             run_id=str(row["run_id"]),
             scope=scope,
             expires_at=_dt_from_iso(row["expires_at"]),
-            created_at=_dt_from_iso(row["created_at"]) or datetime.utcnow(),
+            created_at=_dt_from_iso(row["created_at"]) or _utcnow(),
         )
 
     # ------------------------------------------------------------------
@@ -1427,16 +1844,26 @@ class RunRegistry:
         """Clear DB state and in-memory queues (pytest helper)."""
 
         conn = self._ensure_conn()
+        self._stop_score_flusher()
         with self._db_lock:
+            self._take_pending_scores()
             conn.execute("DELETE FROM shares")
             conn.execute("DELETE FROM runs")
             conn.commit()
-            self._queues.clear()
-            self._loops.clear()
-            self._stop_events.clear()
+            with self._state_lock:
+                self._queues.clear()
+                self._loops.clear()
+                self._stop_events.clear()
 
 
 RUN_REGISTRY = RunRegistry()
 
 
-__all__ = ["RUN_REGISTRY", "RunInfo", "RunRegistry", "ShareToken"]
+__all__ = [
+    "EVENT_BUFFER_SIZE",
+    "EventBuffer",
+    "RUN_REGISTRY",
+    "RunInfo",
+    "RunRegistry",
+    "ShareToken",
+]
@@ -2,37 +2,59 @@
 
 from __future__ import annotations
 
-import glob
+import heapq
 import json
 import os
 from pathlib import Path
 
+try:  # optional "speed" extra
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
 
-ARTIFACT_GLOB = "fort_gym/artifacts/*/summary.json"
+
+ARTIFACTS_DIR = Path("fort_gym/artifacts")
 OUTPUT_PATH = Path("web/leaderboard.json")
+MAX_ROWS = 100
+
+
+def _load_summary(path: str) -> object:
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def collect_rows() -> list[dict[str, object]]:
     rows: list[dict[str, object]] = []
-    for summary_path in glob.glob(ARTIFACT_GLOB):
-        run_dir = os.path.basename(os.path.dirname(summary_path))
-        try:
-            with open(summary_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError):
-            continue
-        rows.append(
-            {
-                "run_id": run_dir,
-                "reward_cum": data.get("reward_cum", 0),
-                "steps": data.get("steps", 0),
-                "total_score": data.get("total_score", 0),
-                "model": data.get("model"),
-                "backend": data.get("backend"),
-            }
-        )
-    rows.sort(key=lambda row: (row.get("reward_cum", 0), row.get("steps", 0)), reverse=True)
-    return rows[:100]
+    try:
+        entries = os.scandir(ARTIFACTS_DIR)
+    except OSError:
+        return rows
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                data = _load_summary(os.path.join(entry.path, "summary.json"))
+            except (OSError, ValueError):  # missing/unreadable file or bad JSON
+                continue
+            if not isinstance(data, dict):
+                continue
+            rows.append(
+                {
+                    "run_id": entry.name,
+                    "reward_cum": data.get("reward_cum", 0),
+                    "steps": data.get("steps", 0),
+                    "total_score": data.get("total_score", 0),
+                    "model": data.get("model"),
+                    "backend": data.get("backend"),
+                }
+            )
+    # Same order as a full reverse sort truncated to MAX_ROWS, without
+    # sorting every run.
+    return heapq.nlargest(MAX_ROWS, rows, key=lambda row: (row["reward_cum"], row["steps"]))
 
 
 def main() -> None:
@@ -69,7 +69,13 @@ def main() -> int:
             "work_metrics.lua",
             "complete_dig_rect.lua",
         ]
-        missing = [h for h in expected_hooks if not (hook_dir / h).exists()]
+        # One directory read instead of a stat() per expected hook.
+        try:
+            with os.scandir(hook_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        missing = [h for h in expected_hooks if h not in present]
 
         if missing:
             print(f"⚠️  Missing hook scripts: {', '.join(missing)}")
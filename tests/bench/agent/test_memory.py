@@ -2,6 +2,17 @@ from __future__ import annotations
 
 from fort_gym.bench.agent.memory import MemoryManager
 
+_STEPS = (
+    ("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one"),
+    ("obs two", {"type": "KEYSTROKE", "params": {"keys": ["B"]}}, "res two"),
+    ("obs three", {"type": "KEYSTROKE", "params": {"keys": ["C"]}}, "res three"),
+)
+
+
+def _add_steps(memory: MemoryManager, count: int, *, start: int = 0) -> None:
+    for observation, action, result in _STEPS[start : start + count]:
+        memory.add_step(observation, action, result)
+
 
 def test_memory_context_empty() -> None:
     memory = MemoryManager()
@@ -10,7 +21,7 @@ def test_memory_context_empty() -> None:
 
 def test_memory_window_zero_disables_memory() -> None:
     memory = MemoryManager(window_size=0)
-    memory.add_step("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one")
+    _add_steps(memory, 1)
 
     assert memory.get_context() == ""
     assert memory.summary == ""
@@ -19,13 +30,12 @@ def test_memory_window_zero_disables_memory() -> None:
 
 def test_memory_window_and_summary() -> None:
     memory = MemoryManager(window_size=2, summary_max_chars=500, step_max_chars=80)
-    memory.add_step("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one")
-    memory.add_step("obs two", {"type": "KEYSTROKE", "params": {"keys": ["B"]}}, "res two")
+    _add_steps(memory, 2)
 
     assert memory.summary == ""
     assert len(memory.recent_steps) == 2
 
-    memory.add_step("obs three", {"type": "KEYSTROKE", "params": {"keys": ["C"]}}, "res three")
+    _add_steps(memory, 1, start=2)
 
     assert len(memory.recent_steps) == 2
     assert "Step 1" in memory.summary
@@ -40,8 +50,7 @@ def test_memory_window_and_summary() -> None:
 
 def test_summary_truncation() -> None:
     memory = MemoryManager(window_size=1, summary_max_chars=20, step_max_chars=200)
-    memory.add_step("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one")
-    memory.add_step("obs two", {"type": "KEYSTROKE", "params": {"keys": ["B"]}}, "res two")
+    _add_steps(memory, 2)
 
     assert memory.summary
     assert len(memory.summary) <= 20
@@ -49,9 +58,7 @@ def test_summary_truncation() -> None:
 
 def test_summary_keeps_latest_overflow() -> None:
     memory = MemoryManager(window_size=1, summary_max_chars=100, step_max_chars=40)
-    memory.add_step("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one")
-    memory.add_step("obs two", {"type": "KEYSTROKE", "params": {"keys": ["B"]}}, "res two")
-    memory.add_step("obs three", {"type": "KEYSTROKE", "params": {"keys": ["C"]}}, "res three")
+    _add_steps(memory, 3)
 
     assert "Step 2" in memory.summary
 
@@ -159,9 +166,7 @@ def test_to_dict_load_dict_round_trip() -> None:
         steps=["confirm workshop exists", "finish planned room"],
         current_step="finish planned room",
     )
-    memory.add_step("obs one", {"type": "KEYSTROKE", "params": {"keys": ["A"]}}, "res one")
-    memory.add_step("obs two", {"type": "KEYSTROKE", "params": {"keys": ["B"]}}, "res two")
-    memory.add_step("obs three", {"type": "KEYSTROKE", "params": {"keys": ["C"]}}, "res three")
+    _add_steps(memory, 3)
 
     data = memory.to_dict()
     assert "recent_steps" not in data
@@ -9,4 +9,7 @@ from pathlib import Path
 # before any fixtures/monkeypatching runs.
 _db_root = Path(tempfile.mkdtemp(prefix="fort_gym_test_"))
 os.environ.setdefault("FORT_GYM_DB_PATH", str(_db_root / "fort_gym.sqlite3"))
+# Runs that do not point ARTIFACTS_DIR at their own tmp_path write here rather than into the
+# checkout. mkdtemp is per process, so pytest-xdist workers never share a directory.
+os.environ.setdefault("ARTIFACTS_DIR", str(_db_root / "artifacts"))
 
@@ -627,6 +627,65 @@ def test_public_leaderboard_sorts_by_mean_score_within_same_version(tmp_path) ->
     assert [row["model"] for row in leaderboard] == ["gpt-5.5-vision", "glm-5v"]
 
 
+def test_public_leaderboard_reads_summary_fields_in_sql(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    _make_scored_run(
+        registry, model="glm-5v", seed_save="seed_a", score_version="3", total_score=40.0
+    )
+    bare_id, _ = _make_scored_run(
+        registry, model="glm-5v", seed_save="seed_a", score_version=3, total_score=20.0
+    )
+    registry.set_summary(bare_id, {"score_version": 3.0, "survival_score": 6.0})
+    broken_id, _ = _make_scored_run(
+        registry, model="glm-5v", seed_save="seed_a", score_version=3, total_score=99.0
+    )
+    conn = registry._ensure_conn()
+    with registry._db_lock:
+        conn.execute("UPDATE runs SET summary_json = '{not json' WHERE run_id = ?", (broken_id,))
+        conn.commit()
+
+    [row] = registry.public_leaderboard()
+
+    assert (row["score_version"], row["seed_save"], row["runs"]) == (3, "seed_a", 2)
+    assert row["mean_score"] == 20.0
+    assert row["best_score"] == 40.0
+
+
+def test_public_leaderboard_is_recomputed_only_after_a_write(tmp_path, monkeypatch) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    _make_scored_run(
+        registry, model="glm-5v", seed_save="seed_region3_fresh", score_version=3, total_score=70.0
+    )
+    computed: list[int] = []
+    original = RunRegistry._compute_public_leaderboard
+
+    def counting(self, conn, now, limit):
+        computed.append(limit)
+        return original(self, conn, now, limit)
+
+    monkeypatch.setattr(RunRegistry, "_compute_public_leaderboard", counting)
+
+    first = registry.public_leaderboard()
+    first[0]["mean_score"] = -1.0
+    assert registry.public_leaderboard()[0]["mean_score"] == 70.0
+    assert computed == [50]
+
+    registry.public_leaderboard(limit=10)
+    assert computed == [50, 10]
+
+    _make_scored_run(
+        registry, model="glm-5v", seed_save="seed_region3_fresh", score_version=3, total_score=90.0
+    )
+    [row] = registry.public_leaderboard(limit=10)
+    assert row["runs"] == 2
+    assert row["mean_score"] == 80.0
+    assert computed == [50, 10, 10]
+
+
 def test_best_scores_over_time_never_mixes_score_versions_or_seeds(tmp_path) -> None:
     """Same comparability rule applies to the best-over-time series."""
 
@@ -654,3 +713,594 @@ def test_best_scores_over_time_never_mixes_score_versions_or_seeds(tmp_path) ->
     assert (2, "seed_region1_fresh") in keys
     for item in series:
         assert len(item["points"]) == 1
+
+
+def test_run_listings_report_score_without_decoding_summaries(tmp_path, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from fort_gym.bench.api import server
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setenv("FORT_GYM_INSECURE_ADMIN", "1")
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    monkeypatch.setattr(server, "RUN_REGISTRY", registry)
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    registry.create_share(run.run_id, scope=["live"])
+    registry.set_summary(run.run_id, {"total_score": 12.5, "steps": 2})
+
+    [listed] = registry.list(include_summary=False)
+    assert listed.latest_summary is None
+    assert listed.metadata["last_score"] == 12.5
+    assert registry.list()[0].latest_summary == {"total_score": 12.5, "steps": 2}
+
+    client = TestClient(server.app)
+    assert client.get("/runs").json()[0]["score"] == 12.5
+    assert client.get("/public/runs").json()[0]["score"] == 12.5
+
+
+def test_create_rejects_a_duplicate_run_id_and_keeps_the_writer_usable(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    registry.create(backend="mock", model="a", max_steps=2, ticks_per_step=10, run_id="dup")
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.create(backend="mock", model="b", max_steps=2, ticks_per_step=10, run_id="dup")
+
+    registry.create(backend="mock", model="c", max_steps=2, ticks_per_step=10, run_id="next")
+    assert registry.get("dup").model == "a"
+    assert registry.get("next") is not None
+
+    # Other constraint failures are not reported as duplicates.
+    with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+        registry.create(backend=None, model="d", max_steps=2, ticks_per_step=10, run_id="bad")
+    assert registry.get("bad") is None
+
+
+def test_summary_free_listing_columns_cover_every_other_run_column(tmp_path) -> None:
+    from fort_gym.bench.run.storage import _RUN_LISTING_COLUMNS, RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    columns = {
+        row["name"] for row in registry._read_conn().execute("PRAGMA table_info(runs)")
+    }
+
+    assert set(_RUN_LISTING_COLUMNS.split(", ")) == columns - {"summary_json"}
+
+
+def test_registry_reads_do_not_wait_for_the_write_lock(tmp_path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    share = registry.create_share(run.run_id, scope=["live"])
+    registry.set_summary(run.run_id, {"total_score": 3.0})
+
+    def read_shared_state():
+        registry.append_event(run.run_id, {"t": "state", "data": {"step": 1}})
+        return (
+            registry.get(run.run_id).run_id,
+            registry.get_share(share.token).run_id,
+            [info.run_id for info in registry.list(include_summary=False)],
+            [info.run_id for info, _ in registry.list_public()],
+            registry.stop_requested(run.run_id),
+            registry.public_leaderboard(),
+        )
+
+    # Reads and event streaming go through the read-only connection and the
+    # in-memory state lock, so they complete while a writer holds _db_lock.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with registry._db_lock:
+            got, token_run_id, listed, public_ids, stopped, _board = pool.submit(
+                read_shared_state
+            ).result(timeout=5)
+    assert got == token_run_id == run.run_id
+    assert listed == public_ids == [run.run_id]
+    assert stopped is False
+    assert registry.get_queue(run.run_id).get_nowait()["data"] == {"step": 1}
+
+
+def test_append_event_resolves_the_queue_when_the_callback_runs(tmp_path) -> None:
+    from fort_gym.bench.run.storage import EventBuffer, RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    stale_queue = registry.get_queue(run.run_id)
+
+    class DeferredLoop:
+        def __init__(self) -> None:
+            self.callbacks = []
+
+        def is_running(self) -> bool:
+            return True
+
+        def call_soon_threadsafe(self, callback) -> None:
+            self.callbacks.append(callback)
+
+    loop = DeferredLoop()
+    registry.bind_loop(run.run_id, loop)
+    registry.append_event(run.run_id, {"t": "state", "data": {"step": 1}})
+    assert stale_queue.empty()
+
+    fresh_queue = EventBuffer(maxsize=1)
+    fresh_queue.put_nowait({"t": "old", "data": {}})
+    with registry._state_lock:
+        registry._queues[run.run_id] = fresh_queue
+    [callback] = loop.callbacks
+    callback()
+
+    assert stale_queue.empty()
+    assert fresh_queue.get_nowait() == {"t": "state", "data": {"step": 1}}
+
+
+def test_append_event_falls_back_when_the_loop_closes_mid_schedule(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+
+    class ClosingLoop:
+        def is_running(self) -> bool:
+            return True
+
+        def call_soon_threadsafe(self, _callback) -> None:
+            raise RuntimeError("Event loop is closed")
+
+    registry.bind_loop(run.run_id, ClosingLoop())
+    registry.append_event(run.run_id, {"t": "state", "data": {"step": 2}})
+
+    assert registry.get_queue(run.run_id).get_nowait()["data"] == {"step": 2}
+
+
+def test_create_share_drops_expired_tokens(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    expired = registry.create_share(run.run_id, scope=["live"], ttl_seconds=-1)
+    permanent = registry.create_share(run.run_id, scope=["live"], ttl_seconds=None)
+    assert registry.get_share(expired.token) is None
+
+    live = registry.create_share(run.run_id, scope=["live"])
+
+    conn = sqlite3.connect(tmp_path / "runs.sqlite3")
+    try:
+        tokens = {row[0] for row in conn.execute("SELECT token FROM shares")}
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM shares WHERE expires_at <= ?",
+                ("2026-01-01T00:00:00",),
+            )
+        )
+    finally:
+        conn.close()
+    assert tokens == {permanent.token, live.token}
+    assert "idx_shares_expiry" in plan
+
+
+def test_list_public_pairs_each_shared_run_with_its_best_share(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    multi = registry.create(backend="mock", model="a", max_steps=2, ticks_per_step=10)
+    single = registry.create(backend="mock", model="b", max_steps=2, ticks_per_step=10)
+    unshared = registry.create(backend="mock", model="c", max_steps=2, ticks_per_step=10)
+    registry.create_share(multi.run_id, scope=["live"])
+    full = registry.create_share(multi.run_id, scope=["live", "replay", "export"])
+    live = registry.create_share(single.run_id, scope=["live"])
+    registry.create_share(unshared.run_id, scope=["live"], ttl_seconds=-1)
+    registry.set_summary(multi.run_id, {"total_score": 4.0})
+
+    listed = {info.run_id: (info, share) for info, share in registry.list_public()}
+
+    assert set(listed) == {multi.run_id, single.run_id}
+    assert listed[multi.run_id][1].token == full.token
+    assert listed[multi.run_id][0].latest_summary == {"total_score": 4.0}
+    assert listed[single.run_id][1].token == live.token
+
+
+def test_list_public_for_protocol_bounds_the_cohort_and_picks_best_shares(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    runs = [
+        registry.create(
+            backend="mock",
+            model="m",
+            max_steps=2,
+            ticks_per_step=10,
+            run_id=f"run-{index}",
+            evaluation_protocol="fort-eval-v1",
+        )
+        for index in range(3)
+    ]
+    other = registry.create(
+        backend="mock", model="m", max_steps=2, ticks_per_step=10, evaluation_protocol="other"
+    )
+    registry.create_share(runs[0].run_id, scope=["live"])
+    full = registry.create_share(runs[0].run_id, scope=["live", "replay", "export"])
+    replay = registry.create_share(runs[1].run_id, scope=["replay"])
+    registry.create_share(runs[2].run_id, scope=["live"])
+    registry.create_share(other.run_id, scope=["live"])
+
+    items, truncated = registry.list_public_for_protocol("fort-eval-v1", limit=2)
+
+    assert truncated is True
+    assert [(info.run_id, share.token) for info, share in items] == [
+        ("run-0", full.token),
+        ("run-1", replay.token),
+    ]
+    items, truncated = registry.list_public_for_protocol("fort-eval-v1")
+    assert truncated is False
+    assert [info.run_id for info, _ in items] == ["run-0", "run-1", "run-2"]
+
+
+def test_event_buffer_drops_the_oldest_event_when_full() -> None:
+    import asyncio
+
+    from fort_gym.bench.run.storage import EventBuffer
+
+    async def scenario() -> list:
+        buffer = EventBuffer(maxsize=2)
+        for step in range(3):
+            buffer.put_nowait({"t": "step", "data": {"step": step}})
+        received = [await buffer.get(), buffer.get_nowait()]
+        waiter = asyncio.ensure_future(buffer.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        buffer.put_nowait({"t": "step", "data": {"step": 3}})
+        received.append(await asyncio.wait_for(waiter, timeout=1))
+        with pytest.raises(asyncio.QueueEmpty):
+            buffer.get_nowait()
+        return [item["data"]["step"] for item in received]
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+
+
+def test_event_buffer_wakes_a_consumer_on_another_thread(tmp_path) -> None:
+    import asyncio
+    import threading
+
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    buffer = registry.get_queue(run.run_id)
+    waiting = threading.Event()
+    received: list = []
+
+    async def consume() -> None:
+        getter = asyncio.ensure_future(buffer.get())
+        await asyncio.sleep(0)
+        waiting.set()
+        received.append(await asyncio.wait_for(getter, timeout=5))
+
+    consumer = threading.Thread(target=asyncio.run, args=(consume(),))
+    consumer.start()
+    assert waiting.wait(timeout=5)
+    # No loop is bound to the run, so the producer writes directly from
+    # this thread and the buffer hands the wakeup to the consumer's loop.
+    registry.append_event(run.run_id, {"t": "state", "data": {"step": 1}})
+    consumer.join(timeout=5)
+
+    assert received == [{"t": "state", "data": {"step": 1}}]
+
+
+def test_dropped_live_events_are_reported_in_run_metadata(tmp_path) -> None:
+    from fort_gym.bench.run.storage import EVENT_BUFFER_SIZE, RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    assert "dropped_events" not in registry.get(run.run_id).metadata
+
+    for step in range(EVENT_BUFFER_SIZE + 3):
+        registry.append_event(run.run_id, {"t": "state", "data": {"step": step}})
+
+    assert registry.get(run.run_id).metadata["dropped_events"] == 3
+    assert registry.get_queue(run.run_id).get_nowait()["data"] == {"step": 3}
+
+
+def test_event_buffer_cursors_read_independently_and_skip_overwritten_events() -> None:
+    import asyncio
+
+    from fort_gym.bench.run.storage import EventBuffer
+
+    buffer = EventBuffer(maxsize=3)
+    for step in range(5):
+        buffer.put_nowait({"data": {"step": step}})
+
+    next_seq, events = buffer.since(0)
+    assert next_seq == buffer.write_seq == 5
+    assert [event["data"]["step"] for event in events] == [2, 3, 4]
+    assert buffer.since(4) == (5, [{"data": {"step": 4}}])
+    assert buffer.since(5) == (5, [])
+    assert buffer.dropped == 2
+
+    async def follow() -> tuple:
+        waiter = asyncio.ensure_future(buffer.wait_since(5))
+        other = asyncio.ensure_future(buffer.wait_since(5))
+        await asyncio.sleep(0)
+        buffer.put_nowait({"data": {"step": 5}})
+        return await waiter, await other
+
+    first, second = asyncio.run(follow())
+    assert first == second == (6, [{"data": {"step": 5}}])
+
+
+def test_select_share_prefers_the_widest_scope_in_tier_order() -> None:
+    from datetime import datetime
+
+    from fort_gym.bench.run.storage import RunRegistry, ShareToken
+
+    def share(token: str, *scope: str) -> ShareToken:
+        return ShareToken(
+            token=token,
+            run_id="run",
+            scope=set(scope),
+            expires_at=None,
+            created_at=datetime(2026, 1, 1),
+        )
+
+    live = share("live", "live")
+    replay = share("replay", "replay")
+    evidence = share("evidence", "replay", "export")
+    full = share("full", "live", "replay", "export")
+
+    select = RunRegistry._select_share
+    assert select([live, replay, evidence, full]).token == "full"
+    assert select([live, replay, evidence]).token == "evidence"
+    assert select([live, replay]).token == "replay"
+    assert select([share("export", "export"), live]).token == "live"
+    assert select([share("export", "export")]).token == "export"
+    assert select([]) is None
+
+
+def test_score_events_are_coalesced_into_one_background_write(tmp_path, monkeypatch) -> None:
+    from fort_gym.bench.run import storage
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setattr(storage, "SCORE_FLUSH_INTERVAL_S", 3600)
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    other = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+
+    registry.append_event(run.run_id, {"t": "score", "data": {"total_score": 1.0}})
+    registry.append_event(run.run_id, {"t": "score", "data": {"milestones": ["POP_10"]}})
+    registry.append_event(run.run_id, {"t": "score", "data": {"total_score": 2.5}})
+    registry.append_event(other.run_id, {"t": "score", "data": {"value": 7}})
+
+    def stored(run_id: str):
+        conn = sqlite3.connect(tmp_path / "runs.sqlite3")
+        try:
+            return conn.execute(
+                "SELECT last_score, milestones_json FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    # Nothing is written yet, but reads already see the coalesced values.
+    assert stored(run.run_id) == (None, None)
+    assert registry.get(run.run_id).metadata["last_score"] == 2.5
+    assert registry.get(run.run_id).metadata["milestones"] == ["POP_10"]
+
+    registry.flush_scores()
+    assert stored(run.run_id) == (2.5, '["POP_10"]')
+    assert stored(other.run_id) == (7.0, None)
+
+    # A summary lands any queued score first, so the flusher cannot
+    # overwrite it afterwards.
+    registry.append_event(run.run_id, {"t": "score", "data": {"total_score": 3.0}})
+    registry.set_summary(run.run_id, {"total_score": 9.0})
+    registry.flush_scores()
+    assert stored(run.run_id)[0] == 9.0
+    assert registry.get(run.run_id).metadata["last_score"] == 9.0
+
+
+def test_score_flusher_writes_without_an_explicit_flush(tmp_path, monkeypatch) -> None:
+    import time
+
+    from fort_gym.bench.run import storage
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setattr(storage, "SCORE_FLUSH_INTERVAL_S", 0.01)
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    registry.append_event(run.run_id, {"t": "score", "data": {"score": 4.0}})
+
+    conn = sqlite3.connect(tmp_path / "runs.sqlite3")
+    try:
+        deadline = time.monotonic() + 5
+        while True:
+            row = conn.execute(
+                "SELECT last_score FROM runs WHERE run_id = ?", (run.run_id,)
+            ).fetchone()
+            if row == (4.0,) or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+    finally:
+        conn.close()
+    assert row == (4.0,)
+
+
+def test_flush_takes_pending_scores_under_the_write_lock(tmp_path, monkeypatch) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    registry.append_event(run.run_id, {"t": "score", "data": {"score": 3.0}})
+    # Stop the background flusher so only the calls below take the batch.
+    registry._stop_score_flusher()
+
+    lock_held = []
+    take = registry._take_pending_scores
+
+    def recording_take(run_id=None):
+        lock_held.append(registry._db_lock.locked())
+        return take(run_id)
+
+    monkeypatch.setattr(registry, "_take_pending_scores", recording_take)
+    registry.flush_scores()
+    registry.set_summary(run.run_id, {"total_score": 9.0})
+
+    # A batch taken outside the lock could be written after set_summary()
+    # and overwrite the final score.
+    assert lock_held == [True, True]
+    assert registry.get(run.run_id).metadata["last_score"] == 9.0
+
+
+def test_close_stops_the_score_flusher_and_writes_its_batch(tmp_path, monkeypatch) -> None:
+    from fort_gym.bench.run import storage
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setattr(storage, "SCORE_FLUSH_INTERVAL_S", 60.0)
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+    registry.append_event(run.run_id, {"t": "score", "data": {"score": 5.0}})
+    flusher = registry._score_flusher
+    assert flusher is not None and flusher.is_alive()
+
+    registry.close()
+
+    assert not flusher.is_alive()
+    assert registry._score_flusher is None
+    conn = sqlite3.connect(tmp_path / "runs.sqlite3")
+    try:
+        row = conn.execute(
+            "SELECT last_score FROM runs WHERE run_id = ?", (run.run_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    assert row == (5.0,)
+
+    registry.append_event(run.run_id, {"t": "score", "data": {"score": 6.0}})
+    registry.reset_for_tests()
+    assert registry._score_flusher is None
+
+
+def test_server_shutdown_writes_queued_scores(tmp_path, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from fort_gym.bench.api import server
+    from fort_gym.bench.run import storage
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setattr(storage, "SCORE_FLUSH_INTERVAL_S", 60.0)
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    monkeypatch.setattr(server, "RUN_REGISTRY", registry)
+    run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+
+    with TestClient(server.app):
+        registry.append_event(run.run_id, {"t": "score", "data": {"score": 7.0}})
+
+    assert registry._score_flusher is None
+    reloaded = RunRegistry(db_path=tmp_path / "runs.sqlite3").get(run.run_id)
+    assert reloaded is not None
+    assert reloaded.metadata["last_score"] == 7.0
+
+
+def test_run_listing_and_leaderboard_queries_are_index_ordered(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    for score in range(40):
+        run = registry.create(backend="mock", model="fake", max_steps=2, ticks_per_step=10)
+        registry.create_share(run.run_id, scope=["live"])
+        if score % 2:
+            registry.set_summary(run.run_id, {"total_score": float(score)})
+
+    conn = sqlite3.connect(tmp_path / "runs.sqlite3")
+    try:
+        conn.execute("ANALYZE")
+
+        def plan(sql: str, *params: object) -> str:
+            return " | ".join(
+                str(row[-1]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            )
+
+        listing = plan("SELECT * FROM runs ORDER BY created_at DESC")
+        leaderboard = plan(
+            """
+            SELECT r.run_id FROM runs r JOIN shares s ON s.run_id = r.run_id
+             WHERE (s.expires_at IS NULL OR s.expires_at > ?)
+               AND r.summary_json IS NOT NULL
+             ORDER BY COALESCE(r.ended_at, r.created_at) DESC
+             LIMIT ?
+            """,
+            "2026-01-01T00:00:00",
+            50,
+        )
+    finally:
+        conn.close()
+
+    assert "idx_runs_created" in listing and "TEMP B-TREE" not in listing
+    assert "idx_runs_recent_summary" in leaderboard and "TEMP B-TREE" not in leaderboard
+
+
+def test_registry_connections_are_tuned_for_long_lived_use(tmp_path) -> None:
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    for conn in (registry._ensure_conn(), registry._read_conn()):
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+    writer = registry._ensure_conn()
+    assert writer.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert writer.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_set_status_only_updates_the_fields_it_is_given(tmp_path) -> None:
+    from datetime import datetime
+
+    from fort_gym.bench.run.storage import RunRegistry
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    run = registry.create(backend="mock", model="fake", max_steps=5, ticks_per_step=10)
+    started = datetime(2026, 3, 1, 12, 0, 0)
+
+    registry.set_status(run.run_id, status="running", started_at=started)
+    registry.set_status(run.run_id, step=3)
+    registry.set_status(run.run_id)
+    record = registry.get(run.run_id)
+    assert (record.status, record.step, record.started_at) == ("running", 3, started)
+
+    registry.set_status(run.run_id, status="completed", ended_at=datetime(2026, 3, 1, 13))
+    registry.set_status(run.run_id, status="running", step=4)
+    record = registry.get(run.run_id)
+    assert (record.status, record.step, record.started_at) == ("completed", 4, started)
+    assert record.ended_at == datetime(2026, 3, 1, 13)
+
+
+def test_git_head_is_read_from_loose_packed_and_linked_git_dirs(tmp_path) -> None:
+    from fort_gym.bench.run.storage import _read_git_head
+
+    loose_sha = "a" * 40
+    packed_sha = "b" * 40
+    repo = tmp_path / "repo"
+    git_dir = repo / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text(loose_sha + "\n")
+    assert _read_git_head(repo) == loose_sha
+
+    (git_dir / "refs" / "heads" / "main").unlink()
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{packed_sha} refs/heads/main\n"
+    )
+    assert _read_git_head(repo) == packed_sha
+
+    worktree = tmp_path / "worktree"
+    worktree_git = git_dir / "worktrees" / "wt"
+    worktree_git.mkdir(parents=True)
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_git}\n")
+    (worktree_git / "HEAD").write_text("ref: refs/heads/main\n")
+    (worktree_git / "commondir").write_text("../..\n")
+    assert _read_git_head(worktree) == packed_sha
+
+    (git_dir / "HEAD").write_text(loose_sha + "\n")
+    assert _read_git_head(repo) == loose_sha
@@ -4181,3 +4181,15 @@ def test_governed_evidence_allowlist_excludes_model_authored_line_injection() ->
         "999" not in line
         for line in state["agent_plan_control"]["allowed_evidence_lines"]
     )
+
+
+def test_repeated_screen_reuses_classification_without_sharing_state() -> None:
+    observation = {"time": 100, "population": 7, "viewscreen_type": "viewscreen_dwarfmodest"}
+    screen = "Dwarf Fortress\n  Stocks\n  a: Build  d: Designations"
+
+    _, first = encode_observation(observation, screen_text=screen)
+    first["screen_state"]["evidence"].append("mutated")
+    _, second = encode_observation(observation, screen_text=screen)
+
+    assert "mutated" not in second["screen_state"]["evidence"]
+    assert second["screen_state"]["mode"] == first["screen_state"]["mode"]
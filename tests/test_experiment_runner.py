@@ -123,3 +123,17 @@ def test_p1_experiment_runner_registers_and_shares_public_runs(
     ]
     assert run_calls[0]["run_id"] == "p1-public-run"
     assert run_calls[0]["registry"] is fake_registry
+
+
+def test_memory_window_context_overrides_settings_without_touching_env(monkeypatch) -> None:
+    from fort_gym.bench.experiment import runner as runner_module
+
+    monkeypatch.delenv("FORT_GYM_MEMORY_WINDOW", raising=False)
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+    baseline = get_settings().MEMORY_WINDOW
+
+    with runner_module._memory_window_context(3):
+        assert get_settings().MEMORY_WINDOW == 3
+        assert "FORT_GYM_MEMORY_WINDOW" not in os.environ
+
+    assert get_settings().MEMORY_WINDOW == baseline
@@ -3,6 +3,8 @@ from __future__ import annotations
 import threading
 import time
 
+import pytest
+
 from fort_gym.bench.run.jobs import JobRegistry
 
 
@@ -27,12 +29,7 @@ def test_job_registry_parallel_execution() -> None:
 
     registry.start(job.job_id, make_run)
 
-    for _ in range(200):
-        info = registry.get(job.job_id)
-        if info and info.status == "completed":
-            break
-        time.sleep(0.05)
-
+    assert registry.wait_done(job.job_id, timeout=10.0)
     info = registry.get(job.job_id)
     assert info is not None
     assert info.status == "completed"
@@ -50,3 +47,37 @@ def test_job_registry_serializes_dfhack_jobs() -> None:
 
     mock_job = registry.create(model="random", backend="mock", n=3, parallelism=4)
     assert mock_job.parallelism == 4
+
+
+def test_job_registry_snapshots_do_not_share_run_ids() -> None:
+    registry = JobRegistry()
+    job = registry.create(model="random", backend="mock", n=1, parallelism=1)
+
+    snapshot = registry.get(job.job_id)
+    assert snapshot is not None
+    snapshot.run_ids.append("leaked")
+    snapshot.status = "mutated"
+
+    fresh = registry.get(job.job_id)
+    assert fresh is not None
+    assert fresh.run_ids == []
+    assert fresh.status == "pending"
+    assert registry.list()[0].run_ids == []
+
+
+def test_job_registry_wait_done_returns_when_a_job_fails() -> None:
+    registry = JobRegistry()
+    job = registry.create(model="random", backend="mock", n=2, parallelism=1)
+
+    def make_run() -> str:
+        raise RuntimeError("boom")
+
+    assert registry.wait_done(job.job_id, timeout=0) is False
+    registry.start(job.job_id, make_run)
+
+    assert registry.wait_done(job.job_id, timeout=10.0)
+    info = registry.get(job.job_id)
+    assert info is not None
+    assert info.status == "failed"
+    with pytest.raises(KeyError):
+        registry.wait_done("missing")
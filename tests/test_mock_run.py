@@ -5,13 +5,14 @@ import shutil
 from pathlib import Path
 
 from fort_gym.bench.agent.base import RandomAgent
+from fort_gym.bench.config import get_settings
 from fort_gym.bench.run.runner import run_once
 
 
 def test_mock_run_produces_trace() -> None:
     run_id = run_once(RandomAgent(), env="mock", max_steps=3, ticks_per_step=10)
 
-    artifacts_root = Path(__file__).resolve().parents[1] / "fort_gym" / "artifacts"
+    artifacts_root = Path(get_settings().ARTIFACTS_DIR).resolve()
     artifact_dir = artifacts_root / run_id
     trace_path = artifact_dir / "trace.jsonl"
 
@@ -23,17 +24,203 @@ def test_mock_run_produces_trace() -> None:
 
     assert len(lines) >= 3
 
-    state_events = 0
-    action_events = 0
-    steps = []
-    for record in lines:
-        steps.append(record["step"])
-        events = record.get("events", [])
-        state_events += sum(1 for evt in events if evt.get("type") == "state")
-        action_events += sum(1 for evt in events if evt.get("type") == "action")
-
-    assert state_events >= 3
-    assert action_events >= 3
+    event_types = [evt.get("type") for record in lines for evt in record.get("events", ())]
+    steps = [record["step"] for record in lines]
+
+    assert event_types.count("state") >= 3
+    assert event_types.count("action") >= 3
     assert steps == sorted(steps)
 
     shutil.rmtree(artifact_dir, ignore_errors=True)
+
+
+def test_trace_writer_flushes_queued_rows_in_order(tmp_path) -> None:
+    from fort_gym.bench.run.runner import _TraceWriter
+
+    trace_path = tmp_path / "trace.jsonl"
+    with _TraceWriter(trace_path, batch_size=3) as writer:
+        for step in range(5):
+            writer.write(json.dumps({"step": step}).encode("utf-8") + b"\n")
+        writer.flush()
+        assert len(trace_path.read_text(encoding="utf-8").splitlines()) == 5
+        writer.write(json.dumps({"step": 5}).encode("utf-8") + b"\n")
+
+    rows = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["step"] for row in rows] == [0, 1, 2, 3, 4, 5]
+
+
+def test_json_bytes_falls_back_to_stdlib_for_orjson_rejects(monkeypatch) -> None:
+    from fort_gym.bench.run import runner
+
+    payload = {"step": 1, "huge": 2**70, 3: "int key"}
+    encoded = runner._json_bytes(payload)
+    assert json.loads(encoded) == {"step": 1, "huge": 2**70, "3": "int key"}
+
+    monkeypatch.setattr(runner, "orjson", None)
+    assert json.loads(runner._json_bytes(payload, indent=True)) == json.loads(encoded)
+
+
+def test_trace_row_encodes_shared_observation_once() -> None:
+    import io
+
+    from fort_gym.bench.run import runner
+
+    observation = {"pop": 7, "screen": 'quote " and \x00 nul'}
+    other = {"pop": 7}
+    row = {
+        "observation": observation,
+        "events": [
+            {"type": "state", "data": {"state": observation, "text": "obs"}},
+            {"type": "state", "data": {"state": other}},
+        ],
+    }
+    fh = io.BytesIO()
+    runner._write_jsonl_record(fh, row)
+
+    decoded = json.loads(fh.getvalue())
+    assert decoded["observation"] == observation
+    assert decoded["events"][0]["data"] == {"state": observation, "text": "obs"}
+    assert decoded["events"][1]["data"] == {"state": other}
+    assert row["observation"] is observation
+
+
+def test_run_once_async_runs_concurrently_in_one_loop(tmp_path, monkeypatch) -> None:
+    import asyncio
+
+    from fort_gym.bench.config import get_settings
+    from fort_gym.bench.run.runner import run_once_async
+
+    monkeypatch.setenv("ARTIFACTS_DIR", str(tmp_path))
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    async def main() -> list[str]:
+        return await asyncio.gather(
+            *(
+                run_once_async(RandomAgent(), env="mock", max_steps=2, ticks_per_step=10)
+                for _ in range(3)
+            )
+        )
+
+    try:
+        run_ids = asyncio.run(main())
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    assert len(set(run_ids)) == 3
+    for run_id in run_ids:
+        assert (tmp_path / run_id / "trace.jsonl").is_file()
+        summary = json.loads((tmp_path / run_id / "summary.json").read_text())
+        assert summary["run_id"] == run_id
+        assert not (tmp_path / run_id / "summary.json.tmp").exists()
+
+
+def test_trace_row_stamps_missing_score_versions_without_mutating_input() -> None:
+    import io
+
+    from fort_gym.bench.eval import scoring
+    from fort_gym.bench.run import runner
+
+    score_event = {"type": "score", "data": {"value": 1.0}}
+    row = {"step": 0, "metrics": {"pop": 3}, "score": {"value": 1.0}, "events": [score_event]}
+    fh = io.BytesIO()
+    runner._write_jsonl_record(fh, row)
+
+    decoded = json.loads(fh.getvalue())
+    assert decoded["score_version"] == scoring.SCORE_VERSION
+    assert decoded["metrics"]["score_version"] == scoring.SCORE_VERSION
+    assert decoded["score"]["version"] == scoring.SCORE_VERSION
+    assert decoded["events"][0]["data"]["version"] == scoring.SCORE_VERSION
+    assert row == {
+        "step": 0,
+        "metrics": {"pop": 3},
+        "score": {"value": 1.0},
+        "events": [{"type": "score", "data": {"value": 1.0}}],
+    }
+
+
+def test_fast_steps_coalesce_registry_step_updates(tmp_path, monkeypatch) -> None:
+    from fort_gym.bench.config import get_settings
+    from fort_gym.bench.run import runner
+    from fort_gym.bench.run.storage import RunRegistry
+
+    monkeypatch.setenv("ARTIFACTS_DIR", str(tmp_path))
+    monkeypatch.setattr(runner, "STEP_STATUS_INTERVAL_S", 3600.0)
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    created = registry.create(backend="mock", model="random", max_steps=5, ticks_per_step=10)
+    step_only_updates: list[int] = []
+    original_set_status = registry.set_status
+
+    def recording_set_status(run_id, **kwargs):
+        if set(kwargs) == {"step"}:
+            step_only_updates.append(kwargs["step"])
+        return original_set_status(run_id, **kwargs)
+
+    monkeypatch.setattr(registry, "set_status", recording_set_status)
+    try:
+        run_once(
+            RandomAgent(),
+            backend="mock",
+            model="random",
+            max_steps=5,
+            ticks_per_step=10,
+            run_id=created.run_id,
+            registry=registry,
+        )
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    loaded = registry.get(created.run_id)
+    assert loaded is not None
+    assert step_only_updates == [0]
+    assert loaded.status == "completed"
+    assert loaded.step == 4
+
+
+def test_coalesced_step_is_written_before_the_next_decide(tmp_path, monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from fort_gym.bench.config import get_settings
+    from fort_gym.bench.run import runner
+    from fort_gym.bench.run.storage import RunRegistry
+
+    # Every clock read advances 0.3s against a 0.5s interval: an end-of-step
+    # write is skipped, and the same step lands before the next decide.
+    clock = {"now": 0.0}
+
+    def fake_monotonic() -> float:
+        clock["now"] += 0.3
+        return clock["now"]
+
+    monkeypatch.setenv("ARTIFACTS_DIR", str(tmp_path))
+    monkeypatch.setattr(runner, "STEP_STATUS_INTERVAL_S", 0.5)
+    monkeypatch.setattr(runner, "time", SimpleNamespace(monotonic=fake_monotonic))
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    registry = RunRegistry(db_path=tmp_path / "runs.sqlite3")
+    created = registry.create(backend="mock", model="random", max_steps=5, ticks_per_step=10)
+    step_only_updates: list[int] = []
+    original_set_status = registry.set_status
+
+    def recording_set_status(run_id, **kwargs):
+        if set(kwargs) == {"step"}:
+            step_only_updates.append(kwargs["step"])
+        return original_set_status(run_id, **kwargs)
+
+    monkeypatch.setattr(registry, "set_status", recording_set_status)
+    try:
+        run_once(
+            RandomAgent(),
+            backend="mock",
+            model="random",
+            max_steps=5,
+            ticks_per_step=10,
+            run_id=created.run_id,
+            registry=registry,
+        )
+    finally:
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    assert step_only_updates == [0, 1, 2, 3]
+    assert registry.get(created.run_id).step == 4
@@ -4,25 +4,31 @@ from datetime import datetime
 from pathlib import Path
 import uuid
 
+import pytest
 from fastapi.testclient import TestClient
 
 
-def test_public_routes_exist() -> None:
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/r/{token}",
+        "/replay/{token}",
+        "/public/runs",
+        "/public/worlds",
+        "/public/overview",
+        "/public/leaderboard",
+        "/public/runs/{token}",
+        "/public/runs/{token}/summary",
+        "/public/runs/{token}/preview",
+        "/public/runs/{token}/social-card.png",
+        "/public/runs/{token}/events/stream",
+        "/public/runs/{token}/events/replay",
+    ],
+)
+def test_public_routes_exist(path: str) -> None:
     from fort_gym.bench.api.server import app
 
-    paths = {route.path for route in app.routes if hasattr(route, "path")}
-    assert "/r/{token}" in paths
-    assert "/replay/{token}" in paths
-    assert "/public/runs" in paths
-    assert "/public/worlds" in paths
-    assert "/public/overview" in paths
-    assert "/public/leaderboard" in paths
-    assert "/public/runs/{token}" in paths
-    assert "/public/runs/{token}/summary" in paths
-    assert "/public/runs/{token}/preview" in paths
-    assert "/public/runs/{token}/social-card.png" in paths
-    assert "/public/runs/{token}/events/stream" in paths
-    assert "/public/runs/{token}/events/replay" in paths
+    assert path in {route.path for route in app.routes if hasattr(route, "path")}
 
 
 def test_public_html_entrypoints_are_not_cached() -> None:
@@ -220,6 +220,7 @@ def _run_dfhack_tick_fixture(
     *,
     max_steps: int,
     requested_ticks: int = 10,
+    pause_calls: list[int] | None = None,
 ) -> tuple[CountingWaitAgent, RunRegistry, str]:
     monkeypatch.setenv("ARTIFACTS_DIR", str(tmp_path))
     monkeypatch.setenv("DFHACK_ENABLED", "1")
@@ -236,7 +237,8 @@ def _run_dfhack_tick_fixture(
             return None
 
         def pause(self) -> None:
-            return None
+            if pause_calls is not None:
+                pause_calls.append(int(state.get("time") or 0))
 
         def advance(self, ticks: int) -> Dict[str, Any]:
             self.last_tick_info = dict(next(tick_info_sequence))
@@ -337,6 +339,28 @@ def test_positive_ticks_with_unverified_repause_are_terminal(tmp_path, monkeypat
     get_settings.cache_clear()  # type: ignore[attr-defined]
 
 
+def test_verified_repause_skips_the_next_step_pause_rpc(tmp_path, monkeypatch) -> None:
+    pause_calls: list[int] = []
+    repaused = {"ok": True, "ticks_advanced": 10, "paused_after": True}
+    unverified = {"ok": True, "ticks_advanced": 10, "paused_after": None}
+    _agent, registry, run_id = _run_dfhack_tick_fixture(
+        tmp_path,
+        monkeypatch,
+        [repaused, unverified, repaused, repaused],
+        max_steps=4,
+        pause_calls=pause_calls,
+    )
+
+    loaded = registry.get(run_id)
+    assert loaded is not None
+    assert loaded.status == "completed", loaded.metadata
+    # Steps 1 and 3 follow a verified repause and skip the RPC; step 2 follows
+    # an unverified one and pauses again. The last pause is runtime release.
+    assert pause_calls == [0, 20, 40]
+
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+
 def test_governed_work_metrics_setup_failure_cleans_runtime_before_failed_status(
     tmp_path, monkeypatch
 ) -> None:
@@ -327,3 +327,18 @@ def test_chair_factory_shape_ranks_below_pass_shape() -> None:
     )
 
     assert chair_factory_total < pass_total
+
+
+def test_composite_score_reuses_precomputed_components() -> None:
+    from fort_gym.bench.eval.scoring import composite_score, score_components
+
+    payload = {
+        "duration_ticks": 1200,
+        "peak_pop": 7,
+        "drink_availability": 0.5,
+        "created_wealth": 250,
+        "work_progress": 3,
+        "hostiles_present": True,
+    }
+
+    assert composite_score(payload, score_components(payload)) == composite_score(payload)
@@ -25,6 +25,30 @@ def test_reset_current_from_seed_copies_and_makes_writable(tmp_path):
     assert os.access(current_file, os.W_OK)
 
 
+def test_reset_falls_back_to_copytree_when_cp_clone_fails(monkeypatch, tmp_path):
+    from fort_gym.bench.run import seed_reset
+
+    dfroot = tmp_path / "df"
+    seed_dir = dfroot / "data" / "seed_saves" / "seed_region2_fresh"
+    nested = seed_dir / "raw" / "objects"
+    nested.mkdir(parents=True)
+    (nested / "bar.txt").write_text("deep", encoding="utf-8")
+    (nested / "bar.txt").chmod(0o444)
+    monkeypatch.setattr(
+        seed_reset.subprocess,
+        "run",
+        lambda *_args, **_kwargs: SimpleNamespace(returncode=1),
+    )
+
+    seed_reset.reset_current_from_seed(
+        "seed_region2_fresh", dfroot=dfroot, restart_service=False
+    )
+
+    copied = dfroot / "data" / "save" / "current" / "raw" / "objects" / "bar.txt"
+    assert copied.read_text(encoding="utf-8") == "deep"
+    assert os.access(copied, os.W_OK)
+
+
 def test_reset_current_from_seed_prefers_seed_saves_dir(tmp_path):
     from fort_gym.bench.run.seed_reset import reset_current_from_seed
 
@@ -83,11 +107,12 @@ def test_reset_save_from_seed_fails_when_world_copy_differs(monkeypatch, tmp_pat
             restart_service=False,
         )
 
-def test_reset_current_from_seed_rejects_bad_name(tmp_path):
+@pytest.mark.parametrize("name", ["../bad", "..", "/abs", "nested/save", "win\\path"])
+def test_reset_current_from_seed_rejects_bad_name(tmp_path, name):
     from fort_gym.bench.run.seed_reset import SeedResetError, reset_current_from_seed
 
-    with pytest.raises(SeedResetError):
-        reset_current_from_seed("../bad", dfroot=tmp_path, restart_service=False)
+    with pytest.raises(SeedResetError, match="Invalid seed save name"):
+        reset_current_from_seed(name, dfroot=tmp_path, restart_service=False)
 
 
 def test_reset_current_from_seed_handles_permission_error(monkeypatch, tmp_path):
@@ -100,9 +125,10 @@ def test_reset_current_from_seed_handles_permission_error(monkeypatch, tmp_path)
     (seed_dir / "foo.txt").write_text("hi", encoding="utf-8")
 
     # Simulate permissions preventing Path.is_dir() from stat'ing the seed.
-    monkeypatch.setattr(
-        type(seed_dir), "is_dir", lambda _self: (_ for _ in ()).throw(PermissionError())
-    )
+    def denied_is_dir(_self) -> bool:
+        raise PermissionError()
+
+    monkeypatch.setattr(type(seed_dir), "is_dir", denied_is_dir)
     monkeypatch.setattr(seed_reset, "_sudo_is_dir", lambda _p: True)
     monkeypatch.setattr(seed_reset, "_make_writable", lambda _p: None)
 
@@ -350,3 +376,101 @@ def test_run_create_request_validates_seed_names():
     for bad in ("../etc", "a/b", "region3;rm"):
         with pytest.raises(ValidationError):
             RunCreateRequest(seed_save=bad)
+
+
+def test_make_writable_walks_tree_when_chmod_is_unavailable(monkeypatch, tmp_path):
+    from fort_gym.bench.run import seed_reset
+
+    nested = tmp_path / "save" / "raw"
+    nested.mkdir(parents=True)
+    target = nested / "baz.txt"
+    target.write_text("x", encoding="utf-8")
+    target.chmod(0o444)
+
+    def missing_chmod(*_args, **_kwargs):
+        raise FileNotFoundError("chmod")
+
+    monkeypatch.setattr(seed_reset.subprocess, "check_call", missing_chmod)
+    seed_reset._make_writable(tmp_path / "save")
+
+    assert os.access(target, os.W_OK)
+
+
+def test_wait_for_map_loaded_backs_off_between_probes(monkeypatch):
+    from fort_gym.bench.run import seed_reset
+
+    outputs = iter(["FG_MAP_NOT_LOADED"] * 12 + ["FG_MAP_LOADED"])
+    sleeps: list[float] = []
+    monkeypatch.setattr(seed_reset, "run_lua_expr", lambda *_a, **_k: next(outputs))
+    monkeypatch.setattr(seed_reset.time, "sleep", sleeps.append)
+
+    seed_reset._wait_for_map_loaded(timeout_s=90.0)
+
+    assert sleeps[0] == pytest.approx(0.02)
+    assert sleeps == sorted(sleeps)
+    assert max(sleeps) == pytest.approx(0.5)
+
+
+def test_copytree_fallback_sets_write_bits_on_files_and_dirs(monkeypatch, tmp_path):
+    import stat
+
+    from fort_gym.bench.run import seed_reset
+
+    seed_dir = tmp_path / "seed"
+    nested = seed_dir / "raw"
+    nested.mkdir(parents=True)
+    (nested / "qux.txt").write_text("q", encoding="utf-8")
+    (nested / "qux.txt").chmod(0o444)
+    nested.chmod(0o555)
+    monkeypatch.setattr(seed_reset, "_clone_tree", lambda *_args: False)
+    monkeypatch.setattr(
+        seed_reset,
+        "_make_writable",
+        lambda _path: pytest.fail("copytree fallback should not re-walk files"),
+    )
+
+    runtime_dir = tmp_path / "current"
+    try:
+        seed_reset._reset_with_shutil(seed_dir, runtime_dir)
+    finally:
+        nested.chmod(0o755)
+
+    assert (runtime_dir / "raw").stat().st_mode & stat.S_IWUSR
+    assert (runtime_dir / "raw" / "qux.txt").stat().st_mode & stat.S_IWUSR
+
+
+def test_copy_writable_falls_back_when_copy_file_range_fails(monkeypatch, tmp_path):
+    from fort_gym.bench.run import seed_reset
+
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"\x00\x01" * 4096)
+    src.chmod(0o444)
+
+    def unsupported(*_args):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(seed_reset.os, "copy_file_range", unsupported, raising=False)
+    dst = tmp_path / "dst.bin"
+    seed_reset._copy_writable(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mode & 0o200
+
+
+def test_copy_writable_falls_back_when_copy_file_range_copies_nothing(monkeypatch, tmp_path):
+    from fort_gym.bench.run import seed_reset
+
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"\x00\x01" * 4096)
+
+    # Some kernels report 0 (EOF) without copying, e.g. across filesystems.
+    monkeypatch.setattr(seed_reset.os, "copy_file_range", lambda *_args: 0, raising=False)
+    dst = tmp_path / "dst.bin"
+
+    assert seed_reset._copy_file_range(str(src), str(dst)) is False
+    seed_reset._copy_writable(str(src), str(dst))
+    assert dst.read_bytes() == src.read_bytes()
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert seed_reset._copy_file_range(str(empty), str(tmp_path / "empty-copy.bin")) is True
@@ -4,10 +4,43 @@ from fort_gym.bench.api.sse import sse_event
 
 
 def test_sse_event_formatting() -> None:
-    payload = {"ok": 1}
-    frame = sse_event("state", payload)
+    frame = sse_event("state", {"ok": 1})
 
-    assert frame.startswith("event: state\n")
-    assert "data: {\"ok\": 1}" in frame
-    assert frame.endswith("\n\n")
-    assert frame.count("\n\n") == 1
+    assert frame == 'event: state\ndata: {"ok": 1}\n\n'
+
+
+def test_sse_event_includes_the_event_id_when_given() -> None:
+    frame = sse_event("state", {"ok": 1}, event_id=7)
+
+    assert frame == 'event: state\nid: 7\ndata: {"ok": 1}\n\n'
+
+
+def test_stream_queue_resumes_after_last_event_id_for_each_client() -> None:
+    import asyncio
+
+    from fort_gym.bench.api.sse import parse_last_event_id, stream_queue
+    from fort_gym.bench.run.storage import EventBuffer
+
+    class OpenRequest:
+        async def is_disconnected(self) -> bool:
+            return False
+
+    async def take(stream, count: int) -> list[str]:
+        return [await stream.__anext__() for _ in range(count)]
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        buffer = EventBuffer(maxsize=4)
+        for step in range(3):
+            buffer.put_nowait({"t": "step", "data": {"step": step}})
+        fresh = stream_queue(OpenRequest(), buffer)
+        resumed = stream_queue(
+            OpenRequest(), buffer, last_event_id=parse_last_event_id("1")
+        )
+        return await take(fresh, 3), await take(resumed, 1)
+
+    fresh, resumed = asyncio.run(scenario())
+
+    assert [frame.split("\n")[1] for frame in fresh] == ["id: 0", "id: 1", "id: 2"]
+    assert resumed == ['event: step\nid: 2\ndata: {"step": 2}\n\n']
+    assert parse_last_event_id("nope") is None
+    assert parse_last_event_id("-3") is None
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import uuid
 from dataclasses import dataclass
@@ -321,12 +320,8 @@ def test_step_updates_artifacts_and_sse(client: TestClient, tmp_path):
 
     queue = RUN_REGISTRY.get_queue(run_id)
     assert queue is not None
-    events = []
-    while True:
-        try:
-            events.append(queue.get_nowait())
-        except asyncio.QueueEmpty:
-            break
+    # The request has returned, so nothing is still producing into the queue.
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
     assert any(evt.get("t") == "step" for evt in events)
     assert any(
         evt.get("t") == "advance" and "tick_advance" in evt.get("data", {})
@@ -176,6 +176,8 @@ def test_summarize_creates_summary(tmp_path) -> None:
 
     summary_path = trace_path.with_name("summary.json")
     assert summary_path.exists()
+    assert not summary_path.with_name("summary.json.tmp").exists()
+    assert json.loads(summary_path.read_text(encoding="utf-8"))["run_id"] == "run-1"
 
 
 def test_summarize_uses_latest_observed_room_counts(tmp_path) -> None: